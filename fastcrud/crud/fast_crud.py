@@ -1,11 +1,27 @@
-from typing import Any, Generic, Union, Optional, Callable
+import asyncio
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Hashable,
+    Iterable,
+    Union,
+    Optional,
+    Callable,
+    Sequence,
+    cast,
+)
 from datetime import datetime, timezone
 
 from pydantic import ValidationError
+from pydantic_core import to_json
 from sqlalchemy import (
     Insert,
+    Integer,
     Result,
     and_,
+    bindparam,
     select,
     update,
     delete,
@@ -15,10 +31,17 @@ from sqlalchemy import (
     desc,
     or_,
     column,
+    literal,
+    literal_column,
+    text,
+    tuple_,
 )
 from sqlalchemy.exc import ArgumentError, MultipleResultsFound, NoResultFound
 from sqlalchemy.sql import Join
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.util import find_tables
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.elements import BinaryExpression, ColumnElement
@@ -40,12 +63,36 @@ from .helper import (
     _extract_matching_columns_from_schema,
     _auto_detect_join_condition,
     _nest_join_data,
+    _get_join_nestings,
     _nest_multi_join_data,
     _handle_null_primary_key_multi_join,
+    _is_sql_expression,
+    _get_schema_input_keys,
+    _dump_schema,
+    _get_dump_fields,
+    _get_statement_key,
+    _encode_cursor,
+    _construct_rows,
+    _get_list_adapter,
+    _decode_cursor,
     JoinConfig,
 )
 
-from ..endpoint.helper import _get_primary_keys
+_FILTER_BIND_PREFIX = "fc_filter_"
+_JOIN_BIND_PREFIX = "fc_join"
+_OFFSET_BIND = "fc_offset"
+_LIMIT_BIND = "fc_limit"
+_CURSOR_BIND = "fc_cursor"
+_TOTAL_COUNT_LABEL = "fc_total_count"
+_PRIMARY_KEY_LABEL = "fc_primary_key"
+_PRIMARY_KEYS_BIND = "fc_primary_keys"
+
+
+def _as_hashable(value: Optional[Union[str, Sequence[str]]]) -> Hashable:
+    """Converts sort arguments into a form usable in a statement cache key."""
+    if value is None or isinstance(value, str):
+        return value
+    return tuple(value)
 
 
 class FastCRUD(
@@ -69,11 +116,15 @@ class FastCRUD(
         is_deleted_column: Optional column name to use for indicating a soft delete. Defaults to `"is_deleted"`.
         deleted_at_column: Optional column name to use for storing the timestamp of a soft delete. Defaults to `"deleted_at"`.
         updated_at_column: Optional column name to use for storing the timestamp of an update. Defaults to `"updated_at"`.
+        trust_db: If `True`, rows returned with `return_as_model` are turned into schema instances with `model_construct`, skipping validation, for schemas whose fields are all plain values. Only enable it when the column types already match the schema. Defaults to `False`.
 
     Methods:
         create:
             Creates a new record in the database from the provided Pydantic schema.
 
+        create_many:
+            Creates multiple records in the database from the provided Pydantic schemas in a single flush.
+
         select:
             Generates a SQL Alchemy `Select` statement with optional filtering and sorting.
 
@@ -95,18 +146,30 @@ class FastCRUD(
         get_multi_joined:
             Fetches multiple records with a join on another model, offering pagination and sorting for the joined tables.
 
+        get_multi_joined_stream:
+            Streams joined records in batches, with the same join, filtering, sorting and pagination options as `get_multi_joined`.
+
+        get_multi_stream:
+            Streams multiple records in batches, with the same filtering, sorting and pagination options as `get_multi`.
+
         get_multi_by_cursor:
             Implements cursor-based pagination for fetching records, ideal for large datasets and infinite scrolling features.
 
         update:
             Updates an existing record or multiple records based on specified filters.
 
+        update_multi:
+            Updates multiple records, each with its own values, in a single batched statement.
+
         db_delete:
             Hard deletes a record or multiple records from the database based on provided filters.
 
         delete:
             Soft deletes a record if it has an `"is_deleted"` attribute (or other attribute as defined by `is_deleted_column`); otherwise, performs a hard delete.
 
+        delete_many:
+            Soft deletes, or hard deletes, every record matching the filters with a single statement and returns how many were deleted.
+
     Examples:
         ??? example "Models and Schemas Used Below"
 
@@ -450,6 +513,8 @@ class FastCRUD(
         "in": lambda column: column.in_,
         "not_in": lambda column: column.not_in,
     }
+    _STATEMENT_CACHE_SIZE = 256
+    _SELECTIN_CHUNK_SIZE = 500
 
     def __init__(
         self,
@@ -457,77 +522,447 @@ class FastCRUD(
         is_deleted_column: str = "is_deleted",
         deleted_at_column: str = "deleted_at",
         updated_at_column: str = "updated_at",
+        trust_db: bool = False,
     ) -> None:
         self.model = model
         self.model_col_names = [col.key for col in model.__table__.columns]
         self.is_deleted_column = is_deleted_column
         self.deleted_at_column = deleted_at_column
         self.updated_at_column = updated_at_column
-        self._primary_keys = _get_primary_keys(self.model)
+        self.trust_db = trust_db
+        self._has_is_deleted_column = is_deleted_column in self.model_col_names
+        self._has_deleted_at_column = deleted_at_column in self.model_col_names
+        self._has_soft_delete_attrs = hasattr(model, is_deleted_column) and hasattr(
+            model, deleted_at_column
+        )
+        self._mapper = inspect(model)
+        self._primary_keys = tuple(self._mapper.primary_key)
+        self._primary_key_names = frozenset(
+            self._mapper.get_property_by_column(primary_key).key
+            for primary_key in self._primary_keys
+        )
+        self._model_columns = {
+            prop.key: getattr(model, prop.key) for prop in self._mapper.column_attrs
+        }
+        self._model_column_names = frozenset(_column.name for _column in self._mapper.c)
+        self._statement_cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sort_clauses: dict[tuple[str, str], ColumnElement] = {}
+        self._filter_factories = self._build_filter_factories(self._model_columns)
+        self._joined_columns: dict[type, dict[str, Any]] = {}
+        self._joined_filter_factories: dict[
+            type, dict[str, tuple[Optional[str], Callable]]
+        ] = {}
+
+    def _build_filter_factories(
+        self, columns: dict[str, Any]
+    ) -> dict[str, tuple[Optional[str], Callable]]:
+        """
+        Builds the `_parse_filters` lookup table for a model's columns.
+
+        Args:
+            columns: The model's column attributes, by attribute name.
+
+        Returns:
+            A dictionary mapping each filter key, such as `"name"` or `"age__gt"`, to its operator (`None` for equality) and a function building the filter from a value.
+        """
+        factories: dict[str, tuple[Optional[str], Callable]] = {}
+        for key, model_column in columns.items():
+            factories[key] = (None, model_column.__eq__)
+            for op, get_filter in self._SUPPORTED_FILTERS.items():
+                factories[f"{key}__{op}"] = (op, get_filter(model_column))
+        return factories
+
+    def _get_filter_factories(
+        self, model: Union[type[ModelType], AliasedClass]
+    ) -> dict[str, tuple[Optional[str], Callable]]:
+        """
+        Returns the `_parse_filters` lookup table for `model`, building it on first use for joined model classes.
+
+        Aliases are not cached, since they may be created for every query.
+
+        Args:
+            model: The model or alias the filters apply to.
+
+        Returns:
+            The lookup table built by `_build_filter_factories`, or an empty dictionary for aliases.
+        """
+        if model is self.model:
+            return self._filter_factories
+        if not isinstance(model, type):
+            return {}
+
+        factories = self._joined_filter_factories.get(model)
+        if factories is None:
+            factories = self._joined_filter_factories[model] = (
+                self._build_filter_factories(self._get_joined_columns(model))
+            )
+        return factories
+
+    def _get_joined_columns(self, model: type[ModelType]) -> dict[str, Any]:
+        """
+        Returns the column attributes of a joined model class by attribute name, building them on first use.
+
+        Args:
+            model: The joined model class.
+
+        Returns:
+            A dictionary mapping attribute names to the model's column attributes.
+        """
+        columns = self._joined_columns.get(model)
+        if columns is None:
+            columns = self._joined_columns[model] = {
+                prop.key: getattr(model, prop.key)
+                for prop in inspect(model).column_attrs
+            }
+        return columns
 
     def _get_sqlalchemy_filter(
         self,
         operator: str,
         value: Any,
-    ) -> Optional[Callable[[str], Callable]]:
+    ) -> Callable[[str], Callable]:
         if operator in {"in", "not_in", "between"}:
             if not isinstance(value, (tuple, list, set)):
                 raise ValueError(f"<{operator}> filter must be tuple, list or set")
-        return self._SUPPORTED_FILTERS.get(operator)
+        sqlalchemy_filter = self._SUPPORTED_FILTERS.get(operator)
+        if sqlalchemy_filter is None:
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        return sqlalchemy_filter
+
+    def _get_column(
+        self, model: Union[type[ModelType], AliasedClass], field_name: str
+    ) -> Any:
+        if model is self.model:
+            column = self._model_columns.get(field_name)
+        elif isinstance(model, type):
+            column = self._get_joined_columns(model).get(field_name)
+        else:
+            column = None
+        if column is not None:
+            return column
+        return getattr(model, field_name, None)
 
     def _parse_filters(
         self, model: Optional[Union[type[ModelType], AliasedClass]] = None, **kwargs
     ) -> list[ColumnElement]:
         model = model or self.model
         filters = []
+        factories = self._get_filter_factories(model)
 
         for key, value in kwargs.items():
-            if "__" in key:
+            factory = factories.get(key)
+            if factory is not None:
+                op, apply_filter = factory
+                if op is None:
+                    filters.append(apply_filter(value))
+                else:
+                    self._get_sqlalchemy_filter(op, value)
+                    filters.append(
+                        apply_filter(*value) if op == "between" else apply_filter(value)
+                    )
+            elif "__" in key:
                 field_name, op = key.rsplit("__", 1)
-                column = getattr(model, field_name, None)
+                column = self._get_column(model, field_name)
                 if column is None:
                     raise ValueError(f"Invalid filter column: {field_name}")
                 if op == "or":
                     or_filters = [
-                        sqlalchemy_filter(column)(or_value)
+                        self._get_sqlalchemy_filter(or_key, or_value)(column)(or_value)
                         for or_key, or_value in value.items()
-                        if (
-                            sqlalchemy_filter := self._get_sqlalchemy_filter(
-                                or_key, or_value
-                            )
-                        )
-                        is not None
                     ]
                     filters.append(or_(*or_filters))
                 else:
                     sqlalchemy_filter = self._get_sqlalchemy_filter(op, value)
-                    if sqlalchemy_filter:
-                        filters.append(
-                            sqlalchemy_filter(column)(value)
-                            if op != "between"
-                            else sqlalchemy_filter(column)(*value)
-                        )
+                    filters.append(
+                        sqlalchemy_filter(column)(value)
+                        if op != "between"
+                        else sqlalchemy_filter(column)(*value)
+                    )
+            else:
+                column = self._get_column(model, key)
+                if column is None:
+                    raise ValueError(f"Invalid filter column: {key}")
+                filters.append(column == value)
+
+        return filters
+
+    def _get_filter_binds(
+        self, prefix: str, filters: dict[str, Any]
+    ) -> Optional[tuple[tuple, dict[str, Any]]]:
+        """
+        Splits filters into a hashable shape and the values to bind into a statement built by `_parse_bound_filters`.
+
+        Args:
+            prefix: Prefix for the bind parameter names.
+            filters: Filters in the same format accepted by `_parse_filters`.
+
+        Returns:
+            A `(shape, params)` tuple, where `shape` identifies the SQL generated for the filters regardless of their
+            values and `params` maps bind parameter names to values, or `None` if the filters can't be expressed with
+            bind parameters (e.g. a value is itself a SQL expression, or an operator is compared to `None`, which
+            SQLAlchemy renders as `IS NULL` or `IS NOT NULL` only for a literal `None`).
+
+        Raises:
+            ValueError: If a filter uses an unsupported operator, or an `in`, `not_in` or `between` filter value is not
+                a tuple, list or set.
+        """
+        shape: list[tuple] = []
+        params: dict[str, Any] = {}
+
+        for key, value in filters.items():
+            if _is_sql_expression(value):
+                return None
+
+            name = f"{prefix}{key}"
+            if "__" not in key:
+                if value is not None:
+                    params[name] = value
+                shape.append((key, value is None))
+                continue
+
+            op = key.rsplit("__", 1)[1]
+            if op == "or":
+                if not isinstance(value, dict):
+                    return None
+                for or_key, or_value in value.items():
+                    if (
+                        or_key in {"is", "is_not", "between"}
+                        or or_value is None
+                        or _is_sql_expression(or_value)
+                    ):
+                        return None
+                    self._get_sqlalchemy_filter(or_key, or_value)
+                    params[f"{name}__{or_key}"] = (
+                        list(or_value) if or_key in {"in", "not_in"} else or_value
+                    )
+                shape.append((key, tuple(value)))
+            elif op in {"is", "is_not"}:
+                if not (value is None or value is True or value is False):
+                    return None
+                shape.append((key, value))
+            elif value is None:
+                return None
+            else:
+                self._get_sqlalchemy_filter(op, value)
+                if op == "between":
+                    if len(value) != 2:
+                        return None
+                    params[f"{name}_0"], params[f"{name}_1"] = value
+                elif op in {"in", "not_in"}:
+                    params[name] = list(value)
+                else:
+                    params[name] = value
+                shape.append((key,))
+
+        return tuple(shape), params
+
+    def _parse_bound_filters(
+        self,
+        prefix: str,
+        model: Optional[Union[type[ModelType], AliasedClass]] = None,
+        **kwargs,
+    ) -> list[ColumnElement]:
+        """
+        Builds the same filters as `_parse_filters`, with values replaced by the bind parameters named by `_get_filter_binds`.
+
+        Args:
+            prefix: Prefix for the bind parameter names.
+            model: The model or alias the filters apply to. Defaults to `self.model`.
+            **kwargs: Filters in the same format accepted by `_parse_filters`.
+
+        Returns:
+            A list of SQLAlchemy filter expressions.
+
+        Raises:
+            ValueError: If a filter refers to a column that doesn't exist or uses an unsupported operator.
+        """
+        model = model or self.model
+        filters: list[ColumnElement] = []
+
+        for key, value in kwargs.items():
+            name = f"{prefix}{key}"
+            if "__" not in key:
+                column = self._get_column(model, key)
+                if column is None:
+                    raise ValueError(f"Invalid filter column: {key}")
+                filters.append(
+                    column.is_(None) if value is None else column == bindparam(name)
+                )
+                continue
+
+            field_name, op = key.rsplit("__", 1)
+            column = self._get_column(model, field_name)
+            if column is None:
+                raise ValueError(f"Invalid filter column: {field_name}")
+
+            if op == "or":
+                filters.append(
+                    or_(
+                        *[
+                            self._get_sqlalchemy_filter(or_key, or_value)(column)(
+                                bindparam(
+                                    f"{name}__{or_key}",
+                                    expanding=or_key in {"in", "not_in"},
+                                )
+                            )
+                            for or_key, or_value in value.items()
+                        ]
+                    )
+                )
+            elif op in {"is", "is_not"}:
+                filters.append(self._SUPPORTED_FILTERS[op](column)(value))
+            elif op == "between":
+                filters.append(
+                    column.between(bindparam(f"{name}_0"), bindparam(f"{name}_1"))
+                )
             else:
-                column = getattr(model, key, None)
-                if column is not None:
-                    filters.append(column == value)
+                filters.append(
+                    self._get_sqlalchemy_filter(op, value)(column)(
+                        bindparam(name, expanding=op in {"in", "not_in"})
+                    )
+                )
 
         return filters
 
+    def _get_join_binds(
+        self, joins_config: Sequence[JoinConfig]
+    ) -> Optional[tuple[tuple, dict[str, Any]]]:
+        """
+        Splits join configurations into a hashable shape and the values to bind for their filters.
+
+        Args:
+            joins_config: Configurations for all joins.
+
+        Returns:
+            A `(shape, params)` tuple as described in `_get_filter_binds`, or `None` if a join condition or join
+            filter can't be part of a cached statement.
+        """
+        shape: list[tuple] = []
+        params: dict[str, Any] = {}
+
+        for index, join in enumerate(joins_config):
+            filter_binds = self._get_filter_binds(
+                f"{_JOIN_BIND_PREFIX}{index}_", join.filters or {}
+            )
+            if filter_binds is None:
+                return None
+
+            join_on_key = None
+            if join.join_on is not None:
+                join_on_key = _get_statement_key(join.join_on)
+                if join_on_key is None:
+                    return None
+
+            shape.append(
+                (
+                    join.model,
+                    join.alias,
+                    join.join_type,
+                    join.join_prefix,
+                    join.schema_to_select,
+                    join.relationship_type,
+                    join_on_key,
+                    filter_binds[0],
+                )
+            )
+            params.update(filter_binds[1])
+
+        return tuple(shape), params
+
+    def _can_construct(self, schema: type[SelectSchemaType]) -> bool:
+        """
+        Checks whether rows can skip validation and be turned into `schema` instances with `model_construct`.
+
+        Args:
+            schema: The Pydantic schema rows are converted into.
+
+        Returns:
+            `True` if `trust_db` is enabled and every field of `schema` holds a plain value, so no nested model needs
+            to be built from the row.
+        """
+        return self.trust_db and _get_dump_fields(schema) is not None
+
+    def _validate_rows(
+        self,
+        rows: Iterable[Any],
+        schema_to_select: type[SelectSchemaType],
+    ) -> list[Any]:
+        """
+        Validates rows into instances of `schema_to_select` with a single `TypeAdapter` call.
+
+        Result mappings are passed to Pydantic as they are, except for strict schemas, which only accept dictionaries.
+        With `trust_db`, rows for schemas with only plain fields are built without validation by `_construct_rows` instead.
+
+        Args:
+            rows: The rows to validate, as dictionaries or SQLAlchemy `RowMapping` objects.
+            schema_to_select: The Pydantic schema to validate rows into.
+
+        Returns:
+            The validated schema instances.
+
+        Raises:
+            ValueError: If a row fails validation.
+        """
+        if self._can_construct(schema_to_select):
+            return _construct_rows(schema_to_select, rows)
+
+        if schema_to_select.model_config.get("strict", False):
+            rows = [row if isinstance(row, dict) else dict(row) for row in rows]
+
+        try:
+            validated: list[Any] = _get_list_adapter(schema_to_select).validate_python(
+                rows
+            )
+        except ValidationError as e:
+            raise ValueError(
+                f"Data validation error for schema {schema_to_select.__name__}: {e}"
+            )
+
+        return validated
+
+    def _get_cached_statement(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Returns the statement cached under `key`, building and caching it with `build` on a miss.
+
+        The cache holds up to `_STATEMENT_CACHE_SIZE` statements per instance and evicts the least recently used one.
+
+        Args:
+            key: The statement signature. If it isn't hashable, the statement is built without being cached.
+            build: Callable that builds the statement.
+
+        Returns:
+            The cached or newly built statement.
+        """
+        try:
+            stmt = self._statement_cache.get(key)
+        except TypeError:
+            return build()
+
+        if stmt is not None:
+            self._statement_cache.move_to_end(key)
+            return stmt
+
+        stmt = build()
+        self._statement_cache[key] = stmt
+        if len(self._statement_cache) > self._STATEMENT_CACHE_SIZE:
+            self._statement_cache.popitem(last=False)
+
+        return stmt
+
     def _apply_sorting(
         self,
         stmt: Select,
-        sort_columns: Union[str, list[str]],
-        sort_orders: Optional[Union[str, list[str]]] = None,
+        sort_columns: Union[str, Sequence[str]],
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
     ) -> Select:
         """
         Apply sorting to a SQLAlchemy query based on specified column names and sort orders.
 
         Args:
             stmt: The SQLAlchemy `Select` statement to which sorting will be applied.
-            sort_columns: A single column name or a list of column names on which to apply sorting.
-            sort_orders: A single sort order (`"asc"` or `"desc"`) or a list of sort orders corresponding
-                to the columns in `sort_columns`. If not provided, defaults to `"asc"` for each column.
+            sort_columns: A single column name or a sequence (list or tuple) of column names on which to apply sorting.
+            sort_orders: A single sort order (`"asc"` or `"desc"`), applied to every column, or a sequence of
+                sort orders corresponding to the columns in `sort_columns`. If not provided, defaults to `"asc"` for each column.
 
         Raises:
             ValueError: Raised if sort orders are provided without corresponding sort columns,
@@ -557,79 +992,258 @@ class FastCRUD(
         if sort_orders and not sort_columns:
             raise ValueError("Sort orders provided without corresponding sort columns.")
 
-        if sort_columns:
-            if not isinstance(sort_columns, list):
-                sort_columns = [sort_columns]
-
-            if sort_orders:
-                if not isinstance(sort_orders, list):
-                    sort_orders = [sort_orders] * len(sort_columns)
-                if len(sort_columns) != len(sort_orders):
-                    raise ValueError(
-                        "The length of sort_columns and sort_orders must match."
-                    )
+        if not sort_columns:
+            return stmt
 
-                for idx, order in enumerate(sort_orders):
-                    if order not in ["asc", "desc"]:
-                        raise ValueError(
-                            f"Invalid sort order: {order}. Only 'asc' or 'desc' are allowed."
-                        )
+        column_names = (
+            (sort_columns,) if isinstance(sort_columns, str) else tuple(sort_columns)
+        )
 
-            validated_sort_orders = (
-                ["asc"] * len(sort_columns) if not sort_orders else sort_orders
-            )
+        if not sort_orders:
+            orders: tuple[str, ...] = ("asc",) * len(column_names)
+        elif isinstance(sort_orders, str):
+            orders = (sort_orders,) * len(column_names)
+        else:
+            orders = tuple(sort_orders)
+            if len(column_names) != len(orders):
+                raise ValueError(
+                    "The length of sort_columns and sort_orders must match."
+                )
 
-            for idx, column_name in enumerate(sort_columns):
-                column = getattr(self.model, column_name, None)
-                if not column:
+        order_by: list[ColumnElement] = []
+        for sort_key in zip(column_names, orders):
+            sort_clause = self._sort_clauses.get(sort_key)
+            if sort_clause is None:
+                column_name, order = sort_key
+                if order not in ("asc", "desc"):
+                    raise ValueError(
+                        f"Invalid sort order: {order}. Only 'asc' or 'desc' are allowed."
+                    )
+                column = self._get_column(self.model, column_name)
+                if column is None:
                     raise ArgumentError(f"Invalid column name: {column_name}")
+                sort_clause = self._sort_clauses[sort_key] = (
+                    asc(column) if order == "asc" else desc(column)
+                )
+            order_by.append(sort_clause)
 
-                order = validated_sort_orders[idx]
-                stmt = stmt.order_by(asc(column) if order == "asc" else desc(column))
-
-        return stmt
+        return stmt.order_by(*order_by)
 
     def _prepare_and_apply_joins(
         self,
         stmt: Select,
-        joins_config: list[JoinConfig],
+        joins_config: Sequence[JoinConfig],
         use_temporary_prefix: bool = False,
-    ):
+        use_bind_params: bool = False,
+        output_keys: Optional[frozenset[str]] = None,
+    ) -> Select:
         """
         Applies joins to the given SQL statement based on a list of `JoinConfig` objects.
 
+        Joins chosen by `_get_exists_joins` only filter the primary rows, so they are applied as correlated `EXISTS`
+        conditions instead of joins.
+
         Args:
             stmt: The initial SQL statement.
             joins_config: Configurations for all joins.
             use_temporary_prefix: Whether to use or not an additional prefix for joins. Default `False`.
+            use_bind_params: Whether to build join filters with the bind parameters named by `_get_join_binds`. Default `False`.
+            output_keys: If provided, joins without a `schema_to_select` only select the columns whose result key is in this set.
 
         Returns:
             The modified SQL statement with joins applied.
         """
-        for join in joins_config:
+        exists_joins = self._get_exists_joins(joins_config, output_keys)
+        join_columns: list[Any] = []
+        join_filters: list[ColumnElement] = []
+        for index, join in enumerate(joins_config):
             model = join.alias or join.model
-            join_select = _extract_matching_columns_from_schema(
-                model,
-                join.schema_to_select,
-                join.join_prefix,
-                join.alias,
-                use_temporary_prefix,
-            )
-            joined_model_filters = self._parse_filters(
-                model=model, **(join.filters or {})
-            )
+            if use_bind_params:
+                joined_model_filters = self._parse_bound_filters(
+                    f"{_JOIN_BIND_PREFIX}{index}_", model=model, **(join.filters or {})
+                )
+            else:
+                joined_model_filters = self._parse_filters(
+                    model=model, **(join.filters or {})
+                )
 
+            if exists_joins[index]:
+                stmt = stmt.filter(
+                    self._get_join_exists(model, join, joined_model_filters)
+                )
+                continue
+
+            join_select = self._get_join_select(join, use_temporary_prefix, output_keys)
             if join.join_type == "left":
-                stmt = stmt.outerjoin(model, join.join_on).add_columns(*join_select)
+                stmt = stmt.outerjoin(model, join.join_on)
             elif join.join_type == "inner":
-                stmt = stmt.join(model, join.join_on).add_columns(*join_select)
+                stmt = stmt.join(model, join.join_on)
             else:  # pragma: no cover
                 raise ValueError(f"Unsupported join type: {join.join_type}.")
-            if joined_model_filters:
-                stmt = stmt.filter(*joined_model_filters)
+            join_columns.extend(join_select)
+            join_filters.extend(joined_model_filters)
+
+        if join_columns:
+            stmt = stmt.add_columns(*join_columns)
+        if join_filters:
+            stmt = stmt.filter(*join_filters)
 
         return stmt
 
+    @staticmethod
+    def _get_join_select(
+        join: JoinConfig,
+        use_temporary_prefix: bool = False,
+        output_keys: Optional[frozenset[str]] = None,
+    ) -> list[Any]:
+        """
+        Returns the columns selected from the joined model of `join`.
+
+        Args:
+            join: The join configuration.
+            use_temporary_prefix: Whether to use or not an additional prefix for joins. Default `False`.
+            output_keys: If provided and `join` has no `schema_to_select`, only the columns whose result key is in this set are returned.
+
+        Returns:
+            The selected columns of the join.
+        """
+        join_select = _extract_matching_columns_from_schema(
+            join.alias or join.model,
+            join.schema_to_select,
+            join.join_prefix,
+            join.alias,
+            use_temporary_prefix,
+        )
+        if output_keys is not None and join.schema_to_select is None:
+            join_select = [
+                column for column in join_select if column.key in output_keys
+            ]
+        return join_select
+
+    def _get_exists_joins(
+        self,
+        joins_config: Sequence[JoinConfig],
+        output_keys: Optional[frozenset[str]] = None,
+    ) -> tuple[bool, ...]:
+        """
+        Decides, for each join, whether it is applied as a correlated `EXISTS` condition instead of a join.
+
+        An inner one-to-one join that contributes no selected columns and isn't referenced by a later join only filters
+        the primary rows. The decision changes the number of rows a query returns when such a join matches more than
+        one row, so statements built from it must be cached under it and counted with the same decision.
+
+        Args:
+            joins_config: Configurations for all joins.
+            output_keys: Result keys read from joins without a `schema_to_select`, as passed to `_prepare_and_apply_joins`.
+
+        Returns:
+            A tuple holding `True` for each join of `joins_config` applied as an `EXISTS` condition.
+        """
+        return tuple(
+            join.join_type == "inner"
+            and join.relationship_type != "one-to-many"
+            and join.join_on is not None
+            and not self._get_join_select(join, output_keys=output_keys)
+            and not self._is_join_referenced(
+                join.alias or join.model, joins_config[index + 1 :]
+            )
+            for index, join in enumerate(joins_config)
+        )
+
+    @staticmethod
+    def _get_join_exists(
+        model: Union[type[ModelType], AliasedClass],
+        join: JoinConfig,
+        join_filters: Sequence[ColumnElement],
+    ) -> ColumnElement:
+        """
+        Builds the correlated `EXISTS` condition applied in place of a join chosen by `_get_exists_joins`.
+
+        Args:
+            model: The joined model or alias.
+            join: The join configuration.
+            join_filters: The parsed filters of `join`.
+
+        Returns:
+            An `EXISTS` condition over the rows of `model` matching the join condition and `join_filters`.
+        """
+        condition: ColumnElement = (
+            select(literal_column("1"))
+            .select_from(model)
+            .where(join.join_on, *join_filters)
+            .exists()
+        )
+        return condition
+
+    @staticmethod
+    def _is_join_referenced(
+        model: Union[type[ModelType], AliasedClass], joins_config: Sequence[JoinConfig]
+    ) -> bool:
+        """
+        Checks whether the join condition of any of `joins_config` references the table of `model`.
+
+        Args:
+            model: The joined model or alias.
+            joins_config: The joins applied after the join of `model`.
+
+        Returns:
+            `True` if a later join condition is missing or references `model`, so `model` must stay in the `FROM` clause.
+        """
+        selectable = cast(Any, inspect(model)).selectable
+        return any(
+            join.join_on is None
+            or selectable
+            in find_tables(join.join_on, check_columns=True, include_aliases=True)
+            for join in joins_config
+        )
+
+    def _get_join_semi_join(
+        self, joins_config: Sequence[JoinConfig], use_bind_params: bool = False
+    ) -> ColumnElement:
+        """
+        Builds a condition keeping only the primary records that have a row in the joins of `joins_config`.
+
+        Inner joins and join filters drop the primary records without a matching joined row from a joined query. Join
+        strategies that page primary records before joining apply this condition to the page, so the page and its total
+        hold the same records as with the `"join"` strategy.
+
+        Args:
+            joins_config: Configurations for all joins.
+            use_bind_params: Whether to build join filters with the bind parameters named by `_get_join_binds`. Default `False`.
+
+        Returns:
+            An `IN` condition on the primary key over the primary keys of the joined rows.
+        """
+        stmt = select(*self._primary_keys)
+        join_filters: list[ColumnElement] = []
+        for index, join in enumerate(joins_config):
+            model = join.alias or join.model
+            if join.join_type == "inner":
+                stmt = stmt.join(model, join.join_on)
+            else:
+                stmt = stmt.outerjoin(model, join.join_on)
+            if use_bind_params:
+                join_filters.extend(
+                    self._parse_bound_filters(
+                        f"{_JOIN_BIND_PREFIX}{index}_",
+                        model=model,
+                        **(join.filters or {}),
+                    )
+                )
+            else:
+                join_filters.extend(
+                    self._parse_filters(model=model, **(join.filters or {}))
+                )
+
+        stmt = stmt.filter(*join_filters).correlate(None)
+        primary_key = (
+            self._primary_keys[0]
+            if len(self._primary_keys) == 1
+            else tuple_(*self._primary_keys)
+        )
+        condition: ColumnElement = primary_key.in_(stmt)
+        return condition
+
     async def create(
         self, db: AsyncSession, object: CreateSchemaType, commit: bool = True
     ) -> ModelType:
@@ -644,18 +1258,54 @@ class FastCRUD(
         Returns:
             The created database object.
         """
-        object_dict = object.model_dump()
+        object_dict = _dump_schema(object)
         db_object: ModelType = self.model(**object_dict)
         db.add(db_object)
         if commit:
             await db.commit()
         return db_object
 
+    async def create_many(
+        self,
+        db: AsyncSession,
+        objects: Sequence[CreateSchemaType],
+        commit: bool = True,
+    ) -> list[ModelType]:
+        """
+        Create multiple records in the database with a single commit.
+
+        All records are added to the session together, so SQLAlchemy can insert them with batched statements and the
+        transaction is committed once instead of once per record.
+
+        Args:
+            db: The SQLAlchemy async session.
+            objects: The Pydantic schemas containing the data to be saved.
+            commit: If `True`, commits the transaction immediately. Default is `True`.
+
+        Returns:
+            The created database objects, in the same order as `objects`.
+
+        Examples:
+            ```python
+            items = await item_crud.create_many(
+                db,
+                [CreateItemSchema(name="First"), CreateItemSchema(name="Second")],
+            )
+            ```
+        """
+        db_objects: list[ModelType] = [
+            self.model(**_dump_schema(object)) for object in objects
+        ]
+        db.add_all(db_objects)
+        if commit:
+            await db.commit()
+        return db_objects
+
     async def select(
         self,
         schema_to_select: Optional[type[SelectSchemaType]] = None,
-        sort_columns: Optional[Union[str, list[str]]] = None,
-        sort_orders: Optional[Union[str, list[str]]] = None,
+        sort_columns: Optional[Union[str, Sequence[str]]] = None,
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
         **kwargs: Any,
     ) -> Select:
         """
@@ -769,20 +1419,20 @@ class FastCRUD(
             user = await user_crud.get(db, username__ne='admin')
             ```
         """
-        stmt = await self.select(schema_to_select=schema_to_select, **kwargs)
+        stmt, params = self._get_select_statement(
+            schema_to_select=schema_to_select,
+            sort_columns=None,
+            sort_orders=None,
+            filters=kwargs,
+        )
 
-        db_row = await db.execute(stmt)
-        result: Optional[Row] = db_row.one_or_none() if one_or_none else db_row.first()
-        if result is None:
-            return None
-        out: dict = dict(result._mapping)
-        if not return_as_model:
-            return out
-        if not schema_to_select:
-            raise ValueError(
-                "schema_to_select must be provided when return_as_model is True."
-            )
-        return schema_to_select(**out)
+        db_row = await db.execute(stmt, params)
+        return self._as_single_response(
+            db_row,
+            schema_to_select=schema_to_select,
+            return_as_model=return_as_model,
+            one_or_none=one_or_none,
+        )
 
     def _get_pk_dict(self, instance):
         return {pk.name: getattr(instance, pk.name) for pk in self._primary_keys}
@@ -928,7 +1578,7 @@ class FastCRUD(
             where=and_(*filters) if filters else None,
         )
         params = [
-            self.model(**instance.model_dump()).__dict__ for instance in instances
+            self.model(**_dump_schema(instance)).__dict__ for instance in instances
         ]
         return statement, params
 
@@ -950,7 +1600,7 @@ class FastCRUD(
             where=and_(*filters) if filters else None,
         )
         params = [
-            self.model(**instance.model_dump()).__dict__ for instance in instances
+            self.model(**_dump_schema(instance)).__dict__ for instance in instances
         ]
         return statement, params
 
@@ -971,7 +1621,7 @@ class FastCRUD(
             | update_set_override,
         )
         params = [
-            self.model(**instance.model_dump()).__dict__ for instance in instances
+            self.model(**_dump_schema(instance)).__dict__ for instance in instances
         ]
         return statement, params
 
@@ -1013,16 +1663,14 @@ class FastCRUD(
             exists = await user_crud.exists(db, username__ne='admin')
             ```
         """
-        filters = self._parse_filters(**kwargs)
-        stmt = select(self.model).filter(*filters).limit(1)
-
-        result = await db.execute(stmt)
-        return result.first() is not None
+        stmt, params = self._get_probe_statement(kwargs, limit=1)
+        return await db.scalar(stmt, params) is not None
 
     async def count(
         self,
         db: AsyncSession,
         joins_config: Optional[list[JoinConfig]] = None,
+        approximate: bool = False,
         **kwargs: Any,
     ) -> int:
         """
@@ -1035,6 +1683,7 @@ class FastCRUD(
         Args:
             db: The database session to use for the operation.
             joins_config: Optional configuration for applying joins in the count query.
+            approximate: If `True` and neither filters nor `joins_config` are given, return the planner's row estimate from `pg_class.reltuples` instead of running `COUNT(*)`. Only used on PostgreSQL when the table has been analyzed; otherwise an exact count is performed.
             **kwargs: Filters to apply for the count, including field names for equality checks or with comparison operators for advanced queries.
 
         Returns:
@@ -1059,6 +1708,12 @@ class FastCRUD(
             count = await user_crud.count(db, username__ne='admin')
             ```
 
+            Estimate the total number of users (PostgreSQL), e.g. for a paginator:
+
+            ```python
+            count = await user_crud.count(db, approximate=True)
+            ```
+
             Count projects with at least one participant (many-to-many relationship):
             ```python
             joins_config = [
@@ -1094,61 +1749,169 @@ class FastCRUD(
             count = await crud.count(db, joins_config=joins_config)
             ```
         """
-        primary_filters = self._parse_filters(**kwargs)
+        if approximate and joins_config is None and not kwargs:
+            estimate = await self._estimate_count(db)
+            if estimate is not None:
+                return estimate
 
-        if joins_config is not None:
-            primary_keys = [p.name for p in _get_primary_keys(self.model)]
-            if not any(primary_keys):  # pragma: no cover
-                raise ValueError(
-                    f"The model '{self.model.__name__}' does not have a primary key defined, which is required for counting with joins."
-                )
-            to_select = [
-                getattr(self.model, pk).label(f"distinct_{pk}") for pk in primary_keys
-            ]
-            base_query = select(*to_select)
+        return await self._count(db, joins_config, kwargs)
 
-            for join in joins_config:
-                join_model = join.alias or join.model
-                join_filters = (
-                    self._parse_filters(model=join_model, **join.filters)
-                    if join.filters
-                    else []
-                )
-
-                if join.join_type == "inner":
-                    base_query = base_query.join(join_model, join.join_on)
-                else:
-                    base_query = base_query.outerjoin(join_model, join.join_on)
-
-                if join_filters:
-                    base_query = base_query.where(*join_filters)
+    async def _count(
+        self,
+        db: AsyncSession,
+        joins_config: Optional[Sequence[JoinConfig]],
+        filters: dict[str, Any],
+        semi_joins: Sequence[JoinConfig] = (),
+        output_keys: Optional[frozenset[str]] = None,
+    ) -> int:
+        """
+        Runs the statement built by `_get_count_statement`.
 
-            if primary_filters:
-                base_query = base_query.where(*primary_filters)
+        Args:
+            db: The SQLAlchemy async session.
+            joins_config: Optional configuration for applying joins in the count query.
+            filters: Filters to apply to the primary model.
+            semi_joins: Joins that only restrict the counted primary records, applied with `_get_join_semi_join`.
+            output_keys: Result keys read from joins without a `schema_to_select` by the query being counted.
 
-            subquery = base_query.subquery()
-            count_query = select(func.count()).select_from(subquery)
-        else:
-            count_query = select(func.count()).select_from(self.model)
-            if primary_filters:
-                count_query = count_query.where(*primary_filters)
+        Returns:
+            The total number of records matching the filter conditions.
 
-        total_count: Optional[int] = await db.scalar(count_query)
+        Raises:
+            ValueError: If the count query returns no result.
+        """
+        count_query, params = self._get_count_statement(
+            joins_config, filters, semi_joins, output_keys
+        )
+        total_count: Optional[int] = await db.scalar(count_query, params)
         if total_count is None:
             raise ValueError("Could not find the count.")
 
         return total_count
 
+    async def _count_up_to_two(self, db: AsyncSession, filters: dict[str, Any]) -> int:
+        """
+        Counts the records matching `filters`, stopping at two.
+
+        This is enough to tell no match, a single match and multiple matches apart, without counting every match.
+
+        Args:
+            db: The database session to use for the operation.
+            filters: Filters in the same format accepted by `_parse_filters`.
+
+        Returns:
+            `0`, `1` or `2`.
+        """
+        stmt, params = self._get_probe_statement(filters, limit=2)
+        result = await db.execute(stmt, params)
+        return len(result.all())
+
+    def _get_probe_statement(
+        self, filters: dict[str, Any], limit: int
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns a `SELECT 1 ... LIMIT limit` statement over the records matching `filters` and its bind parameters,
+        reusing the cached statement for a repeated filter shape.
+
+        Args:
+            filters: Filters in the same format accepted by `_parse_filters`.
+            limit: The maximum number of rows the statement returns.
+
+        Returns:
+            A `(statement, params)` tuple to pass to `AsyncSession.execute`.
+        """
+
+        def build(use_bind_params: bool) -> Select:
+            stmt: Select = (
+                select(literal_column("1")).select_from(self.model).limit(limit)
+            )
+            if filters:
+                stmt = stmt.filter(
+                    *(
+                        self._parse_bound_filters(_FILTER_BIND_PREFIX, **filters)
+                        if use_bind_params
+                        else self._parse_filters(**filters)
+                    )
+                )
+            return stmt
+
+        filter_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, filters)
+        if filter_binds is None:
+            return build(use_bind_params=False), {}
+
+        return self._get_cached_statement(
+            ("probe", limit, filter_binds[0]),
+            lambda: build(use_bind_params=True),
+        ), filter_binds[1]
+
+    def _single_match_condition(
+        self, filters: Sequence[ColumnElement]
+    ) -> ColumnElement:
+        """
+        Builds a condition that only holds if exactly one record matches `filters`.
+
+        Added to the `WHERE` clause of an `UPDATE` or `DELETE`, it makes the statement affect no row at all when the
+        filters match several records, so a single-record write doesn't need a separate query to check the matches first.
+
+        Args:
+            filters: The parsed filters of the statement.
+
+        Returns:
+            A condition comparing the number of matches, counted up to two, with one.
+        """
+        matches = (
+            select(literal_column("1"))
+            .select_from(self.model)
+            .filter(*filters)
+            .limit(2)
+            .correlate(None)
+            .subquery()
+        )
+        return (
+            select(func.count()).select_from(matches).correlate(None).scalar_subquery()
+            == 1
+        )
+
+    async def _estimate_count(self, db: AsyncSession) -> Optional[int]:
+        """
+        Reads the planner's row estimate for the model's table.
+
+        Args:
+            db: The database session to use for the operation.
+
+        Returns:
+            The estimated number of rows, or `None` if no estimate is available (non-PostgreSQL dialect or a table that was never analyzed).
+        """
+        dialect = db.bind.dialect
+        if dialect.name != "postgresql":
+            return None
+
+        table_name = dialect.identifier_preparer.format_table(self.model.__table__)
+        estimate: Optional[int] = await db.scalar(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table_name)"
+            ),
+            {"table_name": table_name},
+        )
+        if estimate is None or estimate < 0:
+            return None
+
+        return estimate
+
     async def get_multi(
         self,
         db: AsyncSession,
         offset: int = 0,
         limit: Optional[int] = 100,
         schema_to_select: Optional[type[SelectSchemaType]] = None,
-        sort_columns: Optional[Union[str, list[str]]] = None,
-        sort_orders: Optional[Union[str, list[str]]] = None,
+        sort_columns: Optional[Union[str, Sequence[str]]] = None,
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
         return_as_model: bool = False,
         return_total_count: bool = True,
+        use_keyset: bool = False,
+        cursor: Optional[str] = None,
+        parallel_count: bool = False,
         **kwargs: Any,
     ) -> Union[GetMultiResponseModel[SelectSchemaType], GetMultiResponseDict]:
         """
@@ -1164,7 +1927,10 @@ class FastCRUD(
             sort_columns: Column names to sort the results by.
             sort_orders: Corresponding sort orders (`"asc"`, `"desc"`) for each column in `sort_columns`.
             return_as_model: If `True`, returns data as instances of the specified Pydantic model.
-            return_total_count: If `True`, also returns the total count of rows with the selected filters. Useful for pagination.
+            return_total_count: If `True`, also returns the total count of rows with the selected filters. Useful for pagination. Unless `parallel_count` is set, the total is computed in the data query itself with `COUNT(*) OVER ()`, saving a second round trip.
+            use_keyset: If `True`, paginates with a cursor instead of `offset`: rows after `cursor` are selected with a `WHERE` on the sort columns, so deep pages don't scan the skipped rows. The primary key is appended to `sort_columns` to make the order unique. Defaults to `False`.
+            cursor: The `"next_cursor"` returned by the previous page when `use_keyset` is `True`. `None` fetches the first page.
+            parallel_count: If `True` and `return_total_count` is `True`, runs a separate count query concurrently with the data query on a new session bound to the same engine, instead of computing the total in the data query. The data query can then stop at `limit` rows, at the cost of a second connection. The count doesn't see uncommitted changes made in `db`, which must be bound to an `AsyncEngine`, not to an `AsyncConnection`. Defaults to `False`.
             **kwargs: Filters to apply to the query, including advanced comparison operators for more detailed querying.
 
         Returns:
@@ -1172,9 +1938,12 @@ class FastCRUD(
             - With return_as_model=True: Dict with "data": List[SelectSchemaType]
             - With return_as_model=False: Dict with "data": List[Dict[str, Any]]
             - If return_total_count=True, includes "total_count": int
+            - If use_keyset=True, includes "next_cursor": the cursor of the next page, or `None` on the last page
 
         Raises:
             ValueError: If `limit` or `offset` is negative, or if `schema_to_select` is required but not provided or invalid.
+                        Also if `offset` is used with `use_keyset`, or if `cursor` is invalid.
+                        Also if `parallel_count` is used with a session that isn't bound to an `AsyncEngine`.
 
         Examples:
             Fetch the first 10 users:
@@ -1247,45 +2016,336 @@ class FastCRUD(
                 is_active=True,
             )
             ```
+
+            Fetch users page by page with keyset pagination, sorted by creation date:
+
+            ```python
+            page = await user_crud.get_multi(
+                db,
+                limit=10,
+                sort_columns='created_at',
+                use_keyset=True,
+            )
+            next_page = await user_crud.get_multi(
+                db,
+                limit=10,
+                sort_columns='created_at',
+                use_keyset=True,
+                cursor=page['next_cursor'],
+            )
+            ```
+
+        Note:
+            With `use_keyset`, pass the same `sort_columns`, `sort_orders` and filters for every page, and sort by columns that are not `NULL`.
         """
         if (limit is not None and limit < 0) or offset < 0:
             raise ValueError("Limit and offset must be non-negative.")
+        if return_as_model and not schema_to_select:
+            raise ValueError(
+                "schema_to_select must be provided when return_as_model is True."
+            )
+        if use_keyset and offset:
+            raise ValueError(
+                "offset can't be used with use_keyset, pass the cursor instead."
+            )
+        count_engine = (
+            self._get_parallel_count_engine(db)
+            if return_total_count and parallel_count
+            else None
+        )
 
-        stmt = await self.select(
+        rows: list[Any]
+        next_cursor: Optional[str] = None
+        total_count: Optional[int] = None
+        if use_keyset:
+            keyset_rows = self._get_keyset_rows(
+                db=db,
+                limit=limit,
+                schema_to_select=schema_to_select,
+                sort_columns=sort_columns,
+                sort_orders=sort_orders,
+                cursor=cursor,
+                filters=kwargs,
+            )
+            if count_engine is not None:
+                (rows, next_cursor), total_count = await asyncio.gather(
+                    keyset_rows, self._count_in_new_session(count_engine, **kwargs)
+                )
+            else:
+                rows, next_cursor = await keyset_rows
+        else:
+            window_count = return_total_count and not parallel_count
+            stmt, params = self._get_select_statement(
+                schema_to_select=schema_to_select,
+                sort_columns=sort_columns,
+                sort_orders=sort_orders,
+                filters=kwargs,
+                offset=offset,
+                limit=limit,
+                with_total_count=window_count,
+            )
+
+            if count_engine is not None:
+                result, total_count = await asyncio.gather(
+                    db.execute(stmt, params),
+                    self._count_in_new_session(count_engine, **kwargs),
+                )
+            else:
+                result = await db.execute(stmt, params)
+            if window_count:
+                keys = tuple(result.keys())[:-1]
+                counted_rows = result.all()
+                if counted_rows:
+                    total_count = counted_rows[0][-1]
+                elif not offset and limit != 0:
+                    total_count = 0
+                rows = [dict(zip(keys, row)) for row in counted_rows]
+            elif return_as_model:
+                rows = list(result.mappings())
+            else:
+                keys = tuple(result.keys())
+                rows = [dict(zip(keys, row)) for row in result]
+
+        data: list[Any] = rows
+        if return_as_model and schema_to_select:
+            data = self._validate_rows(rows, schema_to_select)
+
+        response: dict[str, Any] = {"data": data}
+
+        if return_total_count:
+            if total_count is None:
+                if use_keyset and cursor is None and next_cursor is None and limit != 0:
+                    total_count = len(data)
+                else:
+                    total_count = await self.count(db=db, **kwargs)
+            response["total_count"] = total_count
+
+        if use_keyset:
+            response["next_cursor"] = next_cursor
+
+        return response
+
+    async def get_multi_stream(
+        self,
+        db: AsyncSession,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        schema_to_select: Optional[type[SelectSchemaType]] = None,
+        sort_columns: Optional[Union[str, Sequence[str]]] = None,
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
+        return_as_model: bool = False,
+        batch_size: int = 500,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[dict, SelectSchemaType]]:
+        """
+        Streams multiple records, fetching and converting them in batches instead of loading the whole result at once.
+
+        Takes the same filtering, sorting and pagination arguments as `get_multi`, but yields one record at a time.
+
+        For filtering details see [the Advanced Filters documentation](../advanced/crud.md/#advanced-filters)
+
+        Args:
+            db: The database session to use for the operation.
+            offset: Starting index for records to fetch, useful for pagination.
+            limit: Maximum number of records to fetch. Defaults to `None`, streaming every matching record.
+            schema_to_select: Optional Pydantic schema for selecting specific columns.
+            sort_columns: Column names to sort the results by.
+            sort_orders: Corresponding sort orders (`"asc"`, `"desc"`) for each column in `sort_columns`.
+            return_as_model: If `True`, yields Pydantic model instances based on `schema_to_select`.
+            batch_size: Number of rows fetched from the database and validated at a time. Defaults to `500`.
+            **kwargs: Filters to apply to the query, including advanced comparison operators for more detailed querying.
+
+        Yields:
+            A dictionary or a Pydantic model instance for each record.
+
+        Raises:
+            ValueError: If `limit` or `offset` is negative, `batch_size` is not positive, or `return_as_model` is `True` but `schema_to_select` is not provided.
+
+        Examples:
+            Export every active user without holding them all in memory:
+
+            ```python
+            async for user in user_crud.get_multi_stream(db, is_active=True):
+                writer.writerow(user)
+            ```
+        """
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError("Limit and offset must be non-negative.")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        if return_as_model and not schema_to_select:
+            raise ValueError(
+                "schema_to_select must be provided when return_as_model is True."
+            )
+
+        stmt, params = self._get_select_statement(
             schema_to_select=schema_to_select,
             sort_columns=sort_columns,
             sort_orders=sort_orders,
-            **kwargs,
+            filters=kwargs,
+            offset=offset,
+            limit=limit,
+        )
+        result = await db.stream(
+            stmt, params, execution_options={"yield_per": batch_size}
         )
+        try:
+            keys = tuple(result.keys())
+            async for partition in result.partitions():
+                if return_as_model and schema_to_select:
+                    for item in self._validate_rows(
+                        [dict(zip(keys, row)) for row in partition], schema_to_select
+                    ):
+                        yield item
+                else:
+                    for row in partition:
+                        yield dict(zip(keys, row))
+        finally:
+            await result.close()
 
-        if offset:
-            stmt = stmt.offset(offset)
-        if limit is not None:
-            stmt = stmt.limit(limit)
+    def _get_keyset(
+        self,
+        sort_columns: Optional[Union[str, Sequence[str]]],
+        sort_orders: Optional[Union[str, Sequence[str]]],
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        Returns the keyset pagination columns and their sort orders: `sort_columns` followed by any primary key column they don't include.
 
-        result = await db.execute(stmt)
-        data = [dict(row) for row in result.mappings()]
+        Args:
+            sort_columns: A single column name or a sequence of column names to sort by.
+            sort_orders: A single sort order, applied to every column, or a sequence of sort orders corresponding to `sort_columns`.
 
-        response: dict[str, Any] = {"data": data}
+        Returns:
+            A `(column_names, sort_orders)` tuple. Primary key columns use the order of the last sort column.
 
-        if return_total_count:
-            total_count = await self.count(db=db, **kwargs)
-            response["total_count"] = total_count
+        Raises:
+            ValueError: If the lengths of `sort_columns` and `sort_orders` don't match.
+        """
+        if not sort_columns:
+            column_names: tuple[str, ...] = ()
+        elif isinstance(sort_columns, str):
+            column_names = (sort_columns,)
+        else:
+            column_names = tuple(sort_columns)
 
-        if return_as_model:
-            if not schema_to_select:
+        if not sort_orders:
+            orders: tuple[str, ...] = ("asc",) * len(column_names)
+        elif isinstance(sort_orders, str):
+            orders = (sort_orders,) * len(column_names)
+        else:
+            orders = tuple(sort_orders)
+            if len(column_names) != len(orders):
                 raise ValueError(
-                    "schema_to_select must be provided when return_as_model is True."
+                    "The length of sort_columns and sort_orders must match."
                 )
-            try:
-                model_data = [schema_to_select(**row) for row in data]
-                response["data"] = model_data
-            except ValidationError as e:
-                raise ValueError(
-                    f"Data validation error for schema {schema_to_select.__name__}: {e}"
+
+        tiebreaker_order = orders[-1] if orders else "asc"
+        for primary_key in self._primary_keys:
+            key = self._mapper.get_property_by_column(primary_key).key
+            if key not in column_names:
+                column_names += (key,)
+                orders += (tiebreaker_order,)
+
+        return column_names, orders
+
+    async def _get_keyset_rows(
+        self,
+        db: AsyncSession,
+        limit: Optional[int],
+        schema_to_select: Optional[type[SelectSchemaType]],
+        sort_columns: Optional[Union[str, Sequence[str]]],
+        sort_orders: Optional[Union[str, Sequence[str]]],
+        cursor: Optional[str],
+        filters: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        Fetches a `get_multi` page with keyset pagination.
+
+        One extra row is fetched to tell whether there is a next page, and the sort key of the last returned row becomes the next cursor.
+
+        Args:
+            db: The SQLAlchemy async session.
+            limit: Maximum number of rows to fetch, or `None` for no limit.
+            schema_to_select: Pydantic schema for selecting specific columns.
+            sort_columns: Column names to sort the results by.
+            sort_orders: Sort orders corresponding to `sort_columns`.
+            cursor: The cursor returned for the previous page, or `None` for the first page.
+            filters: Filters to apply to the query.
+
+        Returns:
+            A `(rows, next_cursor)` tuple. `next_cursor` is `None` on the last page.
+
+        Raises:
+            ValueError: If `cursor` is invalid.
+        """
+        if limit == 0:
+            return [], cursor
+
+        column_names, orders = self._get_keyset(sort_columns, sort_orders)
+        stmt = await self.select(
+            schema_to_select=schema_to_select,
+            sort_columns=column_names,
+            sort_orders=orders,
+            **filters,
+        )
+        key_columns = [self._get_column(self.model, name) for name in column_names]
+
+        if cursor is not None:
+            python_types = []
+            for key_column in key_columns:
+                try:
+                    python_types.append(key_column.type.python_type)
+                except NotImplementedError:  # pragma: no cover
+                    python_types.append(None)
+            values = _decode_cursor(cursor, python_types)
+            bound_values = [
+                literal(value, key_column.type)
+                for key_column, value in zip(key_columns, values)
+            ]
+
+            if len(set(orders)) == 1:
+                key, after = tuple_(*key_columns), tuple_(*bound_values)
+                stmt = stmt.filter(key > after if orders[0] == "asc" else key < after)
+            else:
+                stmt = stmt.filter(
+                    or_(
+                        *[
+                            and_(
+                                *[
+                                    key_column == value
+                                    for key_column, value in zip(
+                                        key_columns[:index], bound_values[:index]
+                                    )
+                                ],
+                                key_columns[index] > bound_values[index]
+                                if order == "asc"
+                                else key_columns[index] < bound_values[index],
+                            )
+                            for index, order in enumerate(orders)
+                        ]
+                    )
                 )
 
-        return response
+        stmt = stmt.add_columns(
+            *[
+                key_column.label(f"{_CURSOR_BIND}_{index}")
+                for index, key_column in enumerate(key_columns)
+            ]
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+
+        result = await db.execute(stmt)
+        key_count = len(key_columns)
+        keys = tuple(result.keys())[:-key_count]
+        rows = list(result.all())
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            del rows[limit:]
+            next_cursor = _encode_cursor(rows[-1][-key_count:])
+
+        return [dict(zip(keys, row)) for row in rows], next_cursor
 
     async def get_joined(
         self,
@@ -1546,15 +2606,9 @@ class FastCRUD(
         elif not joins_config and not join_model:
             raise ValueError("You need one of join_model or joins_config.")
 
-        primary_select = _extract_matching_columns_from_schema(
-            model=self.model,
-            schema=schema_to_select,
-        )
-        stmt: Select = select(*primary_select).select_from(self.model)
-
-        join_definitions = joins_config if joins_config else []
+        join_definitions = tuple(joins_config) if joins_config else ()
         if join_model:
-            join_definitions.append(
+            join_definitions += (
                 JoinConfig(
                     model=join_model,
                     join_on=join_on,
@@ -1564,39 +2618,73 @@ class FastCRUD(
                     alias=alias,
                     filters=join_filters,
                     relationship_type=relationship_type,
-                )
+                ),
             )
 
-        stmt = self._prepare_and_apply_joins(
-            stmt=stmt, joins_config=join_definitions, use_temporary_prefix=nest_joins
-        )
-        primary_filters = self._parse_filters(**kwargs)
-        if primary_filters:
-            stmt = stmt.filter(*primary_filters)
+        def build(use_bind_params: bool) -> Select:
+            primary_select = _extract_matching_columns_from_schema(
+                model=self.model,
+                schema=schema_to_select,
+            )
+            stmt: Select = select(*primary_select).select_from(self.model)
+            stmt = self._prepare_and_apply_joins(
+                stmt=stmt,
+                joins_config=join_definitions,
+                use_temporary_prefix=nest_joins,
+                use_bind_params=use_bind_params,
+            )
+            primary_filters = (
+                self._parse_bound_filters(_FILTER_BIND_PREFIX, **kwargs)
+                if use_bind_params
+                else self._parse_filters(**kwargs)
+            )
+            if primary_filters:
+                stmt = stmt.filter(*primary_filters)
+            return stmt
+
+        primary_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, kwargs)
+        join_binds = self._get_join_binds(join_definitions)
+        if primary_binds is None or join_binds is None:
+            stmt = build(use_bind_params=False)
+            params: dict[str, Any] = {}
+        else:
+            key = (
+                "get_joined",
+                schema_to_select,
+                join_binds[0],
+                primary_binds[0],
+                nest_joins,
+                self._get_exists_joins(join_definitions),
+            )
+            stmt = self._get_cached_statement(key, lambda: build(use_bind_params=True))
+            params = {**primary_binds[1], **join_binds[1]}
 
-        db_rows = await db.execute(stmt)
+        db_rows = await db.execute(stmt, params)
         if any(join.relationship_type == "one-to-many" for join in join_definitions):
             if nest_joins is False:  # pragma: no cover
                 raise ValueError(
                     "Cannot use one-to-many relationship with nest_joins=False"
                 )
-            results = db_rows.fetchall()
-            data_list = [dict(row._mapping) for row in results]
+            keys = tuple(db_rows.keys())
+            data_list = [dict(zip(keys, row)) for row in db_rows]
         else:
+            keys = tuple(db_rows.keys())
             result = db_rows.first()
             if result is not None:
-                data_list = [dict(result._mapping)]
+                data_list = [dict(zip(keys, result))]
             else:
                 data_list = []
 
         if data_list:
             if nest_joins:
                 nested_data: dict = {}
+                join_nestings = _get_join_nestings(join_definitions)
                 for data in data_list:
                     nested_data = _nest_join_data(
                         data,
                         join_definitions,
                         nested_data=nested_data,
+                        join_nestings=join_nestings,
                     )
                 return nested_data
             return data_list[0]
@@ -1617,12 +2705,14 @@ class FastCRUD(
         nest_joins: bool = False,
         offset: int = 0,
         limit: Optional[int] = 100,
-        sort_columns: Optional[Union[str, list[str]]] = None,
-        sort_orders: Optional[Union[str, list[str]]] = None,
+        sort_columns: Optional[Union[str, Sequence[str]]] = None,
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
         return_as_model: bool = False,
         joins_config: Optional[list[JoinConfig]] = None,
         return_total_count: bool = True,
         relationship_type: Optional[str] = None,
+        parallel_count: bool = False,
+        join_strategy: str = "join",
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
@@ -1645,10 +2735,12 @@ class FastCRUD(
             limit: Maximum number of records to fetch in one call. Use `None` for "no limit", fetching all matching rows. Note that in order to use `limit=None`, you'll have to provide a custom endpoint to facilitate it, which you should only do if you really seriously want to allow the user to get all the data at once.
             sort_columns: A single column name or a list of column names on which to apply sorting.
             sort_orders: A single sort order (`"asc"` or `"desc"`) or a list of sort orders corresponding to the columns in `sort_columns`. If not provided, defaults to `"asc"` for each column.
-            return_as_model: If `True`, converts the fetched data to Pydantic models based on `schema_to_select`. Defaults to `False`.
+            return_as_model: If `True`, converts the fetched data to Pydantic models based on `schema_to_select`. For joins without a `schema_to_select`, only the joined columns read by `schema_to_select` are then fetched. Defaults to `False`.
             joins_config: List of `JoinConfig` instances for specifying multiple joins. Each instance defines a model to join with, join condition, optional prefix for column names, schema for selecting specific columns, and join type.
-            return_total_count: If `True`, also returns the total count of rows with the selected filters. Useful for pagination.
+            return_total_count: If `True`, also returns the total count of rows with the selected filters. Useful for pagination. When `joins_config` is used, the total is computed in the data query itself with `COUNT(*) OVER ()`, saving a second round trip.
             relationship_type: Specifies the relationship type, such as `"one-to-one"` or `"one-to-many"`. Used to determine how to nest the joined data. If `None`, uses `"one-to-one"`.
+            parallel_count: If `True` and `return_total_count` is `True`, runs the count query concurrently with the data query on a separate session bound to the same engine. The count then runs on its own connection, so it doesn't see uncommitted changes made in `db`. `db` must be bound to an `AsyncEngine`, not to an `AsyncConnection`. Defaults to `False`.
+            join_strategy: How joined rows are loaded. `"join"` fetches everything in a single joined query, so `offset` and `limit` apply to joined rows. `"selectin"` first fetches a page of primary records, then loads their joined rows with a second query filtered by `IN` on the primary key, so `offset`, `limit` and `total_count` apply to primary records. `"subquery"` pages the primary keys in a derived table and joins everything against it, so `offset`, `limit` and `total_count` apply to primary records within a single query. Prefer `"selectin"` or `"subquery"` for one-to-many joins with a high fan-out. Defaults to `"join"`.
             **kwargs: Filters to apply to the primary query, including advanced comparison operators for refined searching.
 
         Returns:
@@ -1657,6 +2749,8 @@ class FastCRUD(
         Raises:
             ValueError: If either `limit` or `offset` are negative, or if `schema_to_select` is required but not provided or invalid.
                         Also if both `joins_config` and any of the single join parameters are provided or none of `joins_config` and `join_model` is provided.
+                        Also if `join_strategy` is unsupported, or `"selectin"` is used with a model that doesn't have a single primary key.
+                        Also if `parallel_count` is used with a session that isn't bound to an `AsyncEngine`.
 
         Examples:
             Fetching multiple `User` records joined with `Tier` records, using left join, returning raw data:
@@ -1891,6 +2985,24 @@ class FastCRUD(
             )
             # Expect 'posts' to be nested as a list of dictionaries under each user
             ```
+
+            Example loading one-to-many data for a page of ten authors with a second query:
+
+            ```python
+            results = await author_crud.get_multi_joined(
+                db=session,
+                schema_to_select=ReadAuthorSchema,
+                join_model=Article,
+                join_on=Author.id == Article.author_id,
+                join_schema_to_select=ReadArticleSchema,
+                nest_joins=True,
+                offset=0,
+                limit=10,
+                relationship_type='one-to-many',
+                join_strategy='selectin',
+            )
+            # Expect ten authors, each with all of their articles
+            ```
         """
         if joins_config and (
             join_model
@@ -1909,15 +3021,22 @@ class FastCRUD(
         if (limit is not None and limit < 0) or offset < 0:
             raise ValueError("Limit and offset must be non-negative.")
 
+        if join_strategy not in ("join", "selectin", "subquery"):
+            raise ValueError(f"Unsupported join strategy: {join_strategy}.")
+        if join_strategy == "selectin" and len(self._primary_keys) != 1:
+            raise ValueError(
+                "The selectin join strategy requires a model with a single primary key."
+            )
+        count_engine = (
+            self._get_parallel_count_engine(db)
+            if return_total_count and parallel_count
+            else None
+        )
+
         if relationship_type is None:
             relationship_type = "one-to-one"
 
-        primary_select = _extract_matching_columns_from_schema(
-            model=self.model, schema=schema_to_select
-        )
-        stmt: Select = select(*primary_select)
-
-        join_definitions = joins_config if joins_config else []
+        join_definitions = list(joins_config) if joins_config else []
         if join_model:
             try:
                 join_definitions.append(
@@ -1937,48 +3056,104 @@ class FastCRUD(
             except ValueError as e:  # pragma: no cover
                 raise ValueError(f"Could not configure join: {str(e)}")
 
-        stmt = self._prepare_and_apply_joins(
-            stmt=stmt, joins_config=join_definitions, use_temporary_prefix=nest_joins
+        output_keys = (
+            _get_schema_input_keys(schema_to_select)
+            if return_as_model and not nest_joins and schema_to_select is not None
+            else None
+        )
+        window_count = (
+            return_total_count
+            and not parallel_count
+            and (joins_config is not None or join_strategy != "join")
+        )
+        count_joins_config = joins_config if join_strategy == "join" else None
+        semi_joins = (
+            join_definitions
+            if join_strategy != "join"
+            and any(
+                join.join_type == "inner" or join.filters for join in join_definitions
+            )
+            else []
         )
 
-        primary_filters = self._parse_filters(**kwargs)
-        if primary_filters:
-            stmt = stmt.filter(*primary_filters)
-
-        if sort_columns:
-            stmt = self._apply_sorting(stmt, sort_columns, sort_orders)
+        total_count: Optional[int] = None
+        rows: list[Any]
+        if join_strategy == "selectin":
+            rows, total_count = await self._get_selectin_rows(
+                db=db,
+                schema_to_select=schema_to_select,
+                join_definitions=join_definitions,
+                nest_joins=nest_joins,
+                offset=offset,
+                limit=limit,
+                sort_columns=sort_columns,
+                sort_orders=sort_orders,
+                filters=kwargs,
+                with_total_count=window_count,
+                output_keys=output_keys,
+                semi_joins=semi_joins,
+            )
+        else:
+            stmt, params = self._get_multi_joined_statement(
+                schema_to_select=schema_to_select,
+                join_definitions=join_definitions,
+                nest_joins=nest_joins,
+                offset=offset,
+                limit=limit,
+                sort_columns=sort_columns,
+                sort_orders=sort_orders,
+                filters=kwargs,
+                with_total_count=window_count,
+                output_keys=output_keys,
+                paginate_primary=join_strategy == "subquery",
+                semi_joins=semi_joins,
+            )
+            if count_engine is not None:
+                result, total_count = await asyncio.gather(
+                    db.execute(stmt, params),
+                    self._count_in_new_session(
+                        count_engine,
+                        joins_config=count_joins_config,
+                        semi_joins=semi_joins,
+                        output_keys=output_keys,
+                        **kwargs,
+                    ),
+                )
+            else:
+                result = await db.execute(stmt, params)
+
+            if window_count:
+                keys = tuple(result.keys())[:-1]
+                counted_rows = result.all()
+                if counted_rows:
+                    total_count = counted_rows[0][-1]
+                elif not offset and limit != 0:
+                    total_count = 0
+                rows = [dict(zip(keys, row)) for row in counted_rows]
+            elif nest_joins or return_as_model:
+                rows = list(result.mappings())
+            else:
+                keys = tuple(result.keys())
+                rows = [dict(zip(keys, row)) for row in result]
+
+        if nest_joins:
+            join_nestings = _get_join_nestings(join_definitions)
+            rows = [
+                _nest_join_data(
+                    data=row,
+                    join_definitions=join_definitions,
+                    join_nestings=join_nestings,
+                )
+                for row in rows
+            ]
 
-        if offset:
-            stmt = stmt.offset(offset)
-        if limit is not None:
-            stmt = stmt.limit(limit)
-
-        result = await db.execute(stmt)
-        data: list[Union[dict, SelectSchemaType]] = []
-
-        for row in result.mappings().all():
-            row_dict = dict(row)
-
-            if nest_joins:
-                row_dict = _nest_join_data(
-                    data=row_dict,
-                    join_definitions=join_definitions,
+        data: list[Any] = rows
+        if return_as_model and rows:
+            if schema_to_select is None:
+                raise ValueError(
+                    "schema_to_select must be provided when return_as_model is True."
                 )
-
-            if return_as_model:
-                if schema_to_select is None:
-                    raise ValueError(
-                        "schema_to_select must be provided when return_as_model is True."
-                    )
-                try:
-                    model_instance = schema_to_select(**row_dict)
-                    data.append(model_instance)
-                except ValidationError as e:
-                    raise ValueError(
-                        f"Data validation error for schema {schema_to_select.__name__}: {e}"
-                    )
-            else:
-                data.append(row_dict)
+            data = self._validate_rows(rows, schema_to_select)
 
         if nest_joins and any(
             join.relationship_type == "one-to-many" for join in join_definitions
@@ -2005,13 +3180,662 @@ class FastCRUD(
         response: dict[str, Any] = {"data": nested_data}
 
         if return_total_count:
-            total_count: int = await self.count(
-                db=db, joins_config=joins_config, **kwargs
-            )
+            if total_count is None:
+                total_count = await self._count(
+                    db, count_joins_config, kwargs, semi_joins, output_keys
+                )
             response["total_count"] = total_count
 
         return response
 
+    async def get_multi_joined_json(self, db: AsyncSession, **kwargs: Any) -> bytes:
+        """
+        Fetch multiple records with `get_multi_joined` and return the response already encoded as JSON.
+
+        The response is serialized by `pydantic_core`, so an endpoint can return it directly instead of going through FastAPI's `jsonable_encoder` and the standard library `json` module.
+
+        Args:
+            db: The SQLAlchemy async session.
+            **kwargs: The arguments and filters accepted by `get_multi_joined`.
+
+        Returns:
+            The `get_multi_joined` response encoded as UTF-8 JSON bytes.
+
+        Raises:
+            ValueError: For the same reasons as `get_multi_joined`.
+
+        Examples:
+            ```python
+            from fastapi import Response
+
+            @app.get("/users")
+            async def read_users(db: AsyncSession = Depends(get_session)):
+                content = await user_crud.get_multi_joined_json(
+                    db,
+                    schema_to_select=ReadUserSchema,
+                    join_model=Tier,
+                    join_prefix="tier_",
+                    join_schema_to_select=ReadTierSchema,
+                    offset=0,
+                    limit=10,
+                )
+                return Response(content=content, media_type="application/json")
+            ```
+        """
+        return to_json(await self.get_multi_joined(db, **kwargs))
+
+    def _get_select_statement(
+        self,
+        schema_to_select: Optional[type[SelectSchemaType]],
+        sort_columns: Optional[Union[str, Sequence[str]]],
+        sort_orders: Optional[Union[str, Sequence[str]]],
+        filters: dict[str, Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        with_total_count: bool = False,
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the statement built by `select` with pagination applied and its bind parameters, reusing the cached statement for a repeated query shape.
+
+        Args:
+            schema_to_select: Pydantic schema for selecting specific columns.
+            sort_columns: Column names to sort the results by.
+            sort_orders: Sort orders corresponding to `sort_columns`.
+            filters: Filters to apply to the query.
+            offset: The offset for pagination.
+            limit: Maximum number of records to fetch, or `None` for no limit.
+            with_total_count: Whether to add `COUNT(*) OVER ()` as the last selected column, labeled `_TOTAL_COUNT_LABEL`.
+
+        Returns:
+            A `(statement, params)` tuple to pass to `AsyncSession.execute`.
+        """
+
+        def build(use_bind_params: bool) -> Select:
+            to_select = _extract_matching_columns_from_schema(
+                model=self.model, schema=schema_to_select
+            )
+            stmt: Select = select(*to_select).filter(
+                *(
+                    self._parse_bound_filters(_FILTER_BIND_PREFIX, **filters)
+                    if use_bind_params
+                    else self._parse_filters(**filters)
+                )
+            )
+
+            if sort_columns:
+                stmt = self._apply_sorting(stmt, sort_columns, sort_orders)
+
+            if with_total_count:
+                stmt = stmt.add_columns(func.count().over().label(_TOTAL_COUNT_LABEL))
+
+            if offset:
+                stmt = stmt.offset(
+                    bindparam(_OFFSET_BIND, type_=Integer)
+                    if use_bind_params
+                    else offset
+                )
+            if limit is not None:
+                stmt = stmt.limit(
+                    bindparam(_LIMIT_BIND, type_=Integer) if use_bind_params else limit
+                )
+
+            return stmt
+
+        filter_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, filters)
+        if filter_binds is None:
+            return build(use_bind_params=False), {}
+
+        key = (
+            "select",
+            schema_to_select,
+            filter_binds[0],
+            _as_hashable(sort_columns),
+            _as_hashable(sort_orders),
+            bool(offset),
+            limit is None,
+            with_total_count,
+        )
+        params = filter_binds[1]
+        if offset:
+            params[_OFFSET_BIND] = offset
+        if limit is not None:
+            params[_LIMIT_BIND] = limit
+
+        return self._get_cached_statement(
+            key, lambda: build(use_bind_params=True)
+        ), params
+
+    def _get_count_statement(
+        self,
+        joins_config: Optional[Sequence[JoinConfig]],
+        filters: dict[str, Any],
+        semi_joins: Sequence[JoinConfig] = (),
+        output_keys: Optional[frozenset[str]] = None,
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the `count` statement and its bind parameters, reusing the cached statement for a repeated query shape.
+
+        Joins chosen by `_get_exists_joins` are applied as `EXISTS` conditions, as in the `get_multi_joined` query
+        built with the same `output_keys`, so the count matches the rows that query returns.
+
+        Args:
+            joins_config: Optional configuration for applying joins in the count query.
+            filters: Filters to apply to the primary model.
+            semi_joins: Joins that only restrict the counted primary records, applied with `_get_join_semi_join`.
+            output_keys: Result keys read from joins without a `schema_to_select` by the query being counted.
+
+        Returns:
+            A `(statement, params)` tuple to pass to `AsyncSession.execute`.
+        """
+
+        def build(use_bind_params: bool) -> Select:
+            primary_filters = (
+                self._parse_bound_filters(_FILTER_BIND_PREFIX, **filters)
+                if use_bind_params
+                else self._parse_filters(**filters)
+            )
+            count_query = select(func.count()).select_from(self.model)
+
+            for index, join in enumerate(joins_config or ()):
+                join_model = join.alias or join.model
+                join_filters = (
+                    self._parse_bound_filters(
+                        f"{_JOIN_BIND_PREFIX}{index}_",
+                        model=join_model,
+                        **(join.filters or {}),
+                    )
+                    if use_bind_params
+                    else self._parse_filters(model=join_model, **(join.filters or {}))
+                )
+                if exists_joins[index]:
+                    count_query = count_query.where(
+                        self._get_join_exists(join_model, join, join_filters)
+                    )
+                    continue
+
+                if join.join_type == "inner":
+                    count_query = count_query.join(join_model, join.join_on)
+                else:
+                    count_query = count_query.outerjoin(join_model, join.join_on)
+
+                if join_filters:
+                    count_query = count_query.where(*join_filters)
+
+            if semi_joins:
+                primary_filters.append(
+                    self._get_join_semi_join(semi_joins, use_bind_params)
+                )
+            if primary_filters:
+                count_query = count_query.where(*primary_filters)
+
+            return count_query
+
+        exists_joins = (
+            self._get_exists_joins(joins_config, output_keys) if joins_config else ()
+        )
+        primary_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, filters)
+        join_binds = (
+            self._get_join_binds(joins_config) if joins_config is not None else None
+        )
+        semi_join_binds = self._get_join_binds(semi_joins) if semi_joins else None
+        if (
+            primary_binds is None
+            or (joins_config is not None and join_binds is None)
+            or (semi_joins and semi_join_binds is None)
+        ):
+            return build(use_bind_params=False), {}
+
+        key = (
+            "count",
+            primary_binds[0],
+            join_binds[0] if join_binds else None,
+            semi_join_binds[0] if semi_join_binds else None,
+            exists_joins,
+        )
+        params = primary_binds[1]
+        if join_binds:
+            params.update(join_binds[1])
+        if semi_join_binds:
+            params.update(semi_join_binds[1])
+
+        return self._get_cached_statement(
+            key, lambda: build(use_bind_params=True)
+        ), params
+
+    async def get_multi_joined_stream(
+        self,
+        db: AsyncSession,
+        joins_config: list[JoinConfig],
+        schema_to_select: Optional[type[SelectSchemaType]] = None,
+        nest_joins: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        sort_columns: Optional[Union[str, Sequence[str]]] = None,
+        sort_orders: Optional[Union[str, Sequence[str]]] = None,
+        return_as_model: bool = False,
+        batch_size: int = 500,
+        **kwargs: Any,
+    ) -> AsyncIterator[Union[dict, SelectSchemaType]]:
+        """
+        Streams joined records, fetching and converting them in batches instead of loading the whole result at once.
+
+        Takes the same joins, filtering, sorting and pagination arguments as `get_multi_joined` with `joins_config`, but
+        yields one record at a time, so memory stays bounded by `batch_size` however wide the joined rows are.
+
+        For filtering details see [the Advanced Filters documentation](../advanced/crud.md/#advanced-filters)
+
+        Args:
+            db: The SQLAlchemy async session.
+            joins_config: Configurations for all joins. One-to-many joins are not supported, since the rows of a
+                record could be split across batches.
+            schema_to_select: Pydantic schema for selecting specific columns from the primary model.
+            nest_joins: If `True`, nested data structures will be returned where joined model data are nested under the `join_prefix` as a dictionary.
+            offset: The offset (number of records to skip) for pagination.
+            limit: Maximum number of records to fetch. Defaults to `None`, streaming every matching record.
+            sort_columns: A single column name or a list of column names on which to apply sorting.
+            sort_orders: A single sort order (`"asc"` or `"desc"`) or a list of sort orders corresponding to the columns in `sort_columns`.
+            return_as_model: If `True`, yields Pydantic model instances based on `schema_to_select`.
+            batch_size: Number of rows fetched from the database and converted at a time. Defaults to `500`.
+            **kwargs: Filters to apply to the primary query, including advanced comparison operators for refined searching.
+
+        Yields:
+            A dictionary or a Pydantic model instance for each record.
+
+        Raises:
+            ValueError: If `limit` or `offset` is negative, `batch_size` is not positive, a join is one-to-many, or
+                `return_as_model` is `True` but `schema_to_select` is not provided.
+
+        Examples:
+            ```python
+            async for user in user_crud.get_multi_joined_stream(
+                db,
+                joins_config=[
+                    JoinConfig(
+                        model=Tier,
+                        join_on=User.tier_id == Tier.id,
+                        join_prefix="tier_",
+                        schema_to_select=TierSchema,
+                    ),
+                ],
+                nest_joins=True,
+            ):
+                writer.writerow(user)
+            ```
+        """
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError("Limit and offset must be non-negative.")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        if return_as_model and not schema_to_select:
+            raise ValueError(
+                "schema_to_select must be provided when return_as_model is True."
+            )
+        if any(join.relationship_type == "one-to-many" for join in joins_config):
+            raise ValueError(
+                "One-to-many joins are not supported by get_multi_joined_stream."
+            )
+
+        output_keys = (
+            _get_schema_input_keys(schema_to_select)
+            if return_as_model and not nest_joins and schema_to_select is not None
+            else None
+        )
+        stmt, params = self._get_multi_joined_statement(
+            schema_to_select=schema_to_select,
+            join_definitions=joins_config,
+            nest_joins=nest_joins,
+            offset=offset,
+            limit=limit,
+            sort_columns=sort_columns,
+            sort_orders=sort_orders,
+            filters=kwargs,
+            output_keys=output_keys,
+        )
+        join_nestings = _get_join_nestings(joins_config) if nest_joins else None
+
+        result = await db.stream(
+            stmt, params, execution_options={"yield_per": batch_size}
+        )
+        try:
+            keys = tuple(result.keys())
+            async for partition in result.partitions():
+                rows: list[Any] = [dict(zip(keys, row)) for row in partition]
+                if nest_joins:
+                    rows = [
+                        _nest_join_data(
+                            data=row,
+                            join_definitions=joins_config,
+                            join_nestings=join_nestings,
+                        )
+                        for row in rows
+                    ]
+                if return_as_model and schema_to_select:
+                    rows = self._validate_rows(rows, schema_to_select)
+
+                for item in _handle_null_primary_key_multi_join(rows, joins_config):
+                    yield item
+        finally:
+            await result.close()
+
+    def _get_multi_joined_statement(
+        self,
+        schema_to_select: Optional[type[SelectSchemaType]],
+        join_definitions: Sequence[JoinConfig],
+        nest_joins: bool,
+        offset: int,
+        limit: Optional[int],
+        sort_columns: Optional[Union[str, Sequence[str]]],
+        sort_orders: Optional[Union[str, Sequence[str]]],
+        filters: dict[str, Any],
+        with_total_count: bool = False,
+        output_keys: Optional[frozenset[str]] = None,
+        paginate_primary: bool = False,
+        semi_joins: Sequence[JoinConfig] = (),
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Returns the `get_multi_joined` statement and its bind parameters, reusing the cached statement for a repeated query shape.
+
+        With `paginate_primary`, filters, sorting, `offset` and `limit` are applied to the primary keys in a derived table, which the primary model is
+        joined against before the other joins. A page then holds `limit` primary records however many rows each of them joins to.
+
+        Args:
+            schema_to_select: Pydantic schema for selecting specific columns from the primary model.
+            join_definitions: Configurations for all joins.
+            nest_joins: Whether joined columns use the temporary prefix for nesting.
+            offset: The offset for pagination.
+            limit: Maximum number of records to fetch, or `None` for no limit.
+            sort_columns: Column names to sort the results by.
+            sort_orders: Sort orders corresponding to `sort_columns`.
+            filters: Filters to apply to the primary query.
+            with_total_count: Whether to add `COUNT(*) OVER ()` as the last selected column, labeled `_TOTAL_COUNT_LABEL`.
+            output_keys: Result keys read from joins without a `schema_to_select`; other columns of those joins aren't selected.
+            paginate_primary: Whether filters, `offset`, `limit` and the total count apply to primary records instead of joined rows.
+            semi_joins: Joins that only restrict the primary records, applied with `_get_join_semi_join` alongside `filters`.
+
+        Returns:
+            A `(statement, params)` tuple to pass to `AsyncSession.execute`.
+        """
+        primary_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, filters)
+        join_binds = self._get_join_binds(join_definitions)
+        semi_join_binds = self._get_join_binds(semi_joins) if semi_joins else None
+
+        def build(use_bind_params: bool) -> Select:
+            primary_filters = (
+                self._parse_bound_filters(_FILTER_BIND_PREFIX, **filters)
+                if use_bind_params
+                else self._parse_filters(**filters)
+            )
+            if semi_joins:
+                primary_filters.append(
+                    self._get_join_semi_join(semi_joins, use_bind_params)
+                )
+            offset_value: Union[int, ColumnElement[Any]] = (
+                bindparam(_OFFSET_BIND, type_=Integer) if use_bind_params else offset
+            )
+            limit_value: Union[Optional[int], ColumnElement[Any]] = (
+                bindparam(_LIMIT_BIND, type_=Integer) if use_bind_params else limit
+            )
+
+            primary_select = _extract_matching_columns_from_schema(
+                model=self.model, schema=schema_to_select
+            )
+            stmt: Select = select(*primary_select)
+            if paginate_primary:
+                page_stmt: Select = select(*self._primary_keys).filter(*primary_filters)
+                if with_total_count:
+                    page_stmt = page_stmt.add_columns(
+                        func.count().over().label(_TOTAL_COUNT_LABEL)
+                    )
+                if sort_columns:
+                    page_stmt = self._apply_sorting(
+                        page_stmt, sort_columns, sort_orders
+                    )
+                if offset:
+                    page_stmt = page_stmt.offset(offset_value)
+                if limit is not None:
+                    page_stmt = page_stmt.limit(limit_value)
+                page = page_stmt.subquery("primary_page")
+                stmt = stmt.select_from(self.model).join(
+                    page,
+                    and_(
+                        *(
+                            primary_key == page.c[primary_key.key]
+                            for primary_key in self._primary_keys
+                        )
+                    ),
+                )
+            stmt = self._prepare_and_apply_joins(
+                stmt=stmt,
+                joins_config=join_definitions,
+                use_temporary_prefix=nest_joins,
+                use_bind_params=use_bind_params,
+                output_keys=output_keys,
+            )
+
+            if paginate_primary:
+                if with_total_count:
+                    stmt = stmt.add_columns(page.c[_TOTAL_COUNT_LABEL])
+                if sort_columns:
+                    stmt = self._apply_sorting(stmt, sort_columns, sort_orders)
+                return stmt
+
+            if primary_filters:
+                stmt = stmt.filter(*primary_filters)
+
+            if with_total_count:
+                stmt = stmt.add_columns(func.count().over().label(_TOTAL_COUNT_LABEL))
+
+            if sort_columns:
+                stmt = self._apply_sorting(stmt, sort_columns, sort_orders)
+
+            if offset:
+                stmt = stmt.offset(offset_value)
+            if limit is not None:
+                stmt = stmt.limit(limit_value)
+
+            return stmt
+
+        if (
+            primary_binds is None
+            or join_binds is None
+            or (semi_joins and semi_join_binds is None)
+        ):
+            return build(use_bind_params=False), {}
+
+        key = (
+            "get_multi_joined",
+            schema_to_select,
+            join_binds[0],
+            primary_binds[0],
+            nest_joins,
+            _as_hashable(sort_columns),
+            _as_hashable(sort_orders),
+            bool(offset),
+            limit is None,
+            with_total_count,
+            output_keys,
+            paginate_primary,
+            semi_join_binds[0] if semi_join_binds else None,
+            self._get_exists_joins(join_definitions, output_keys),
+        )
+        params = {**primary_binds[1], **join_binds[1]}
+        if semi_join_binds:
+            params.update(semi_join_binds[1])
+        if offset:
+            params[_OFFSET_BIND] = offset
+        if limit is not None:
+            params[_LIMIT_BIND] = limit
+
+        return self._get_cached_statement(
+            key, lambda: build(use_bind_params=True)
+        ), params
+
+    async def _get_selectin_rows(
+        self,
+        db: AsyncSession,
+        schema_to_select: Optional[type[SelectSchemaType]],
+        join_definitions: Sequence[JoinConfig],
+        nest_joins: bool,
+        offset: int,
+        limit: Optional[int],
+        sort_columns: Optional[Union[str, Sequence[str]]],
+        sort_orders: Optional[Union[str, Sequence[str]]],
+        filters: dict[str, Any],
+        with_total_count: bool = False,
+        output_keys: Optional[frozenset[str]] = None,
+        semi_joins: Sequence[JoinConfig] = (),
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        Fetches `get_multi_joined` rows with the `"selectin"` join strategy.
+
+        A page of primary records is fetched first, then the joined columns for those records are loaded with a second query filtered by `IN` on the primary key.
+        The primary keys are bound to an expanding parameter in chunks of `_SELECTIN_CHUNK_SIZE`, so a page without `limit` stays within the bind
+        parameter limits of the driver and every chunk reuses the same cached statement. The rows are stitched together in the same shape the single
+        joined query returns.
+
+        Args:
+            db: The SQLAlchemy async session.
+            schema_to_select: Pydantic schema for selecting specific columns from the primary model.
+            join_definitions: Configurations for all joins.
+            nest_joins: Whether joined columns use the temporary prefix for nesting.
+            offset: The offset for pagination, applied to primary records.
+            limit: Maximum number of primary records to fetch, or `None` for no limit.
+            sort_columns: Column names to sort the results by.
+            sort_orders: Sort orders corresponding to `sort_columns`.
+            filters: Filters to apply to the primary query.
+            with_total_count: Whether to count the primary records matching `filters` in the page query.
+            output_keys: Result keys read from joins without a `schema_to_select`; other columns of those joins aren't selected.
+            semi_joins: Joins that restrict the primary records, applied to the page query with `_get_join_semi_join`.
+
+        Returns:
+            A `(rows, total_count)` tuple. `total_count` is `None` if it wasn't computed.
+        """
+        primary_key = self._primary_keys[0]
+        stmt, params = self._get_multi_joined_statement(
+            schema_to_select=schema_to_select,
+            join_definitions=(),
+            nest_joins=nest_joins,
+            offset=offset,
+            limit=limit,
+            sort_columns=sort_columns,
+            sort_orders=sort_orders,
+            filters=filters,
+            with_total_count=with_total_count,
+            semi_joins=semi_joins,
+        )
+        result = await db.execute(
+            stmt.add_columns(primary_key.label(_PRIMARY_KEY_LABEL)), params
+        )
+        extra_columns = 2 if with_total_count else 1
+        keys = tuple(result.keys())[:-extra_columns]
+        primary_rows = result.all()
+
+        total_count: Optional[int] = None
+        if with_total_count:
+            if primary_rows:
+                total_count = primary_rows[0][-2]
+            elif not offset and limit != 0:
+                total_count = 0
+        if not primary_rows:
+            return [], total_count
+
+        def build(use_bind_params: bool) -> Select:
+            return self._prepare_and_apply_joins(
+                stmt=select(primary_key.label(_PRIMARY_KEY_LABEL)),
+                joins_config=join_definitions,
+                use_temporary_prefix=nest_joins,
+                use_bind_params=use_bind_params,
+                output_keys=output_keys,
+            ).filter(primary_key.in_(bindparam(_PRIMARY_KEYS_BIND, expanding=True)))
+
+        join_binds = self._get_join_binds(join_definitions)
+        if join_binds is None:
+            join_stmt = build(use_bind_params=False)
+            join_params: dict[str, Any] = {}
+        else:
+            key = (
+                "selectin",
+                join_binds[0],
+                nest_joins,
+                output_keys,
+                self._get_exists_joins(join_definitions, output_keys),
+            )
+            join_stmt = self._get_cached_statement(
+                key, lambda: build(use_bind_params=True)
+            )
+            join_params = join_binds[1]
+
+        primary_keys = [row[-1] for row in primary_rows]
+        joined_by_primary_key: dict[Any, list[Sequence[Any]]] = {}
+        for start in range(0, len(primary_keys), self._SELECTIN_CHUNK_SIZE):
+            join_result = await db.execute(
+                join_stmt,
+                {
+                    **join_params,
+                    _PRIMARY_KEYS_BIND: primary_keys[
+                        start : start + self._SELECTIN_CHUNK_SIZE
+                    ],
+                },
+            )
+            join_keys = tuple(join_result.keys())[1:]
+            for join_row in join_result:
+                joined_by_primary_key.setdefault(join_row[0], []).append(join_row[1:])
+
+        return [
+            {**dict(zip(keys, row)), **dict(zip(join_keys, join_values))}
+            for row in primary_rows
+            for join_values in joined_by_primary_key.get(row[-1], ())
+        ], total_count
+
+    @staticmethod
+    def _get_parallel_count_engine(db: AsyncSession) -> AsyncEngine:
+        """
+        Returns the engine `db` is bound to, for the session `parallel_count` runs its count on.
+
+        Args:
+            db: The session the data query runs on.
+
+        Returns:
+            The `AsyncEngine` bound to `db`.
+
+        Raises:
+            ValueError: If `db` is not bound to an `AsyncEngine`. A session bound to an `AsyncConnection` would share
+                that connection with the count, which would then see uncommitted changes and run concurrently with the
+                data query on a single connection.
+        """
+        if not isinstance(db.bind, AsyncEngine):
+            raise ValueError(
+                "parallel_count requires a session bound to an AsyncEngine, not to a connection."
+            )
+
+        return db.bind
+
+    async def _count_in_new_session(
+        self,
+        engine: AsyncEngine,
+        joins_config: Optional[list[JoinConfig]] = None,
+        semi_joins: Sequence[JoinConfig] = (),
+        output_keys: Optional[frozenset[str]] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Counts records on a new session bound to `engine`, so it can run concurrently with a query on another session.
+
+        Args:
+            engine: The engine returned by `_get_parallel_count_engine`.
+            joins_config: Optional configuration for applying joins in the count query.
+            semi_joins: Joins that only restrict the counted primary records, applied with `_get_join_semi_join`.
+            output_keys: Result keys read from joins without a `schema_to_select` by the query being counted.
+            **kwargs: Filters to apply for the count.
+
+        Returns:
+            The total number of records matching the filter conditions.
+        """
+        async with AsyncSession(engine) as count_session:
+            return await self._count(
+                count_session, joins_config, kwargs, semi_joins, output_keys
+            )
+
     async def get_multi_by_cursor(
         self,
         db: AsyncSession,
@@ -2037,7 +3861,7 @@ class FastCRUD(
             **kwargs: Filters to apply to the query, including advanced comparison operators for detailed querying.
 
         Returns:
-            A dictionary containing the fetched rows under `"data"` key and the next cursor value under `"next_cursor"`.
+            A dictionary containing the fetched rows under `"data"` key and the next cursor value under `"next_cursor"`. `"next_cursor"` is `None` when there are no more records.
 
         Examples:
             Fetch the first set of records (e.g., the first page in an infinite scrolling scenario):
@@ -2093,30 +3917,56 @@ class FastCRUD(
         if limit == 0:
             return {"data": [], "next_cursor": None}
 
-        stmt = await self.select(schema_to_select=schema_to_select, **kwargs)
+        def build(use_bind_params: bool) -> Select:
+            to_select = _extract_matching_columns_from_schema(
+                model=self.model, schema=schema_to_select
+            )
+            filters = (
+                self._parse_bound_filters(_FILTER_BIND_PREFIX, **kwargs)
+                if use_bind_params
+                else self._parse_filters(**kwargs)
+            )
+            stmt = select(*to_select).filter(*filters)
 
-        if cursor:
-            if sort_order == "asc":
-                stmt = stmt.filter(getattr(self.model, sort_column) > cursor)
-            else:
-                stmt = stmt.filter(getattr(self.model, sort_column) < cursor)
+            sort_by = getattr(self.model, sort_column)
+            if cursor:
+                cursor_value = bindparam(_CURSOR_BIND) if use_bind_params else cursor
+                if sort_order == "asc":
+                    stmt = stmt.filter(sort_by > cursor_value)
+                else:
+                    stmt = stmt.filter(sort_by < cursor_value)
 
-        stmt = stmt.order_by(
-            asc(getattr(self.model, sort_column))
-            if sort_order == "asc"
-            else desc(getattr(self.model, sort_column))
-        )
-        stmt = stmt.limit(limit)
+            stmt = stmt.order_by(asc(sort_by) if sort_order == "asc" else desc(sort_by))
+            return stmt.limit(
+                bindparam(_LIMIT_BIND, type_=Integer) if use_bind_params else limit + 1
+            )
 
-        result = await db.execute(stmt)
-        data = [dict(row) for row in result.mappings()]
+        filter_binds = self._get_filter_binds(_FILTER_BIND_PREFIX, kwargs)
+        if filter_binds is None or _is_sql_expression(cursor):
+            stmt = build(use_bind_params=False)
+            params: dict[str, Any] = {}
+        else:
+            key = (
+                "get_multi_by_cursor",
+                schema_to_select,
+                filter_binds[0],
+                bool(cursor),
+                sort_column,
+                sort_order,
+            )
+            stmt = self._get_cached_statement(key, lambda: build(use_bind_params=True))
+            params = {**filter_binds[1], _LIMIT_BIND: limit + 1}
+            if cursor:
+                params[_CURSOR_BIND] = cursor
+
+        result = await db.execute(stmt, params)
+        keys = tuple(result.keys())
+        data = [dict(zip(keys, row)) for row in result]
 
         next_cursor = None
-        if len(data) == limit:
-            if sort_order == "asc":
-                next_cursor = data[-1][sort_column]
-            else:
-                data[0][sort_column]
+        if len(data) > limit:
+            del data[limit:]
+            next_cursor = data[-1][sort_column]
 
         return {"data": data, "next_cursor": next_cursor}
 
@@ -2208,13 +4058,14 @@ class FastCRUD(
             )
             ```
         """
-        total_count = await self.count(db, **kwargs)
-        if total_count == 0:
-            raise NoResultFound("No record found to update.")
-        if not allow_multiple and total_count > 1:
-            raise MultipleResultsFound(
-                f"Expected exactly one record to update, found {total_count}."
-            )
+        if not allow_multiple:
+            match_count = await self._count_up_to_two(db, kwargs)
+            if match_count == 0:
+                raise NoResultFound("No record found to update.")
+            if match_count > 1:
+                raise MultipleResultsFound(
+                    "Expected exactly one record to update, found more than one."
+                )
 
         if isinstance(object, dict):
             update_data = object
@@ -2225,14 +4076,13 @@ class FastCRUD(
         if updated_at_col:
             update_data[self.updated_at_column] = datetime.now(timezone.utc)
 
-        update_data_keys = set(update_data.keys())
-        model_columns = {_column.name for _column in inspect(self.model).c}
-        extra_fields = update_data_keys - model_columns
+        extra_fields = update_data.keys() - self._model_column_names
         if extra_fields:
             raise ValueError(f"Extra fields provided: {extra_fields}")
 
-        filters = self._parse_filters(**kwargs)
-        stmt = update(self.model).filter(*filters).values(update_data)
+        stmt = update(self.model).values(update_data)
+        if kwargs:
+            stmt = stmt.filter(*self._parse_filters(**kwargs))
 
         if return_as_model:
             return_columns = self.model_col_names
@@ -2240,14 +4090,19 @@ class FastCRUD(
         if return_columns:
             stmt = stmt.returning(*[column(name) for name in return_columns])
             db_row = await db.execute(stmt)
-            if commit:
-                await db.commit()
             if allow_multiple:
+                updated_rows = db_row.freeze()
+                if not updated_rows.data:
+                    raise NoResultFound("No record found to update.")
+                if commit:
+                    await db.commit()
                 return self._as_multi_response(
-                    db_row,
+                    updated_rows(),
                     schema_to_select=schema_to_select,
                     return_as_model=return_as_model,
                 )
+            if commit:
+                await db.commit()
             return self._as_single_response(
                 db_row,
                 schema_to_select=schema_to_select,
@@ -2255,11 +4110,80 @@ class FastCRUD(
                 one_or_none=one_or_none,
             )
 
-        await db.execute(stmt)
+        result = cast(CursorResult, await db.execute(stmt))
+        if allow_multiple and result.rowcount == 0:
+            raise NoResultFound("No record found to update.")
         if commit:
             await db.commit()
         return None
 
+    async def update_multi(
+        self,
+        db: AsyncSession,
+        objects: Sequence[Union[UpdateSchemaType, dict[str, Any]]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Updates multiple records, each with its own values, in a single batched `UPDATE` statement.
+
+        Every object identifies its record by primary key, and its other fields are the new values. The updates are
+        sent together as an `executemany`, instead of one statement per record.
+
+        Args:
+            db: The database session to use for the operation.
+            objects: The updates, as Pydantic schemas or dictionaries keyed by model attribute names, that include the primary key values.
+            commit: If `True`, commits the transaction immediately. Default is `True`.
+
+        Raises:
+            ValueError: If an object is missing a primary key value or has fields that are not column attributes of the model.
+            sqlalchemy.orm.exc.StaleDataError: If a primary key doesn't match any record.
+
+        Examples:
+            ```python
+            await user_crud.update_multi(
+                db,
+                [
+                    {'id': 1, 'name': 'First'},
+                    {'id': 2, 'name': 'Second'},
+                ],
+            )
+            ```
+        """
+        primary_key_names = [
+            self._mapper.get_property_by_column(pk).key for pk in self._primary_keys
+        ]
+        updated_at_col = getattr(self.model, self.updated_at_column, None)
+        updated_at = datetime.now(timezone.utc) if updated_at_col else None
+
+        rows: list[dict[str, Any]] = []
+        for object in objects:
+            if isinstance(object, dict):
+                update_data = dict(object)
+            else:
+                update_data = object.model_dump(exclude_unset=True)
+
+            missing_keys = [
+                name for name in primary_key_names if update_data.get(name) is None
+            ]
+            if missing_keys:
+                raise ValueError(f"Missing primary key values: {missing_keys}")
+
+            if updated_at_col:
+                update_data[self.updated_at_column] = updated_at
+
+            extra_fields = update_data.keys() - self._model_columns.keys()
+            if extra_fields:
+                raise ValueError(f"Extra fields provided: {extra_fields}")
+
+            rows.append(update_data)
+
+        if not rows:
+            return
+
+        await db.execute(update(self.model), rows)
+        if commit:
+            await db.commit()
+
     def _as_single_response(
         self,
         db_row: Result,
@@ -2268,16 +4192,19 @@ class FastCRUD(
         one_or_none: bool = False,
     ) -> Optional[Union[dict, SelectSchemaType]]:
         result: Optional[Row] = db_row.one_or_none() if one_or_none else db_row.first()
-        if result is None:  # pragma: no cover
+        if result is None:
             return None
-        out: dict = dict(result._mapping)
         if not return_as_model:
-            return out
-        if not schema_to_select:  # pragma: no cover
+            return dict(zip(result._fields, result))
+        if not schema_to_select:
             raise ValueError(
                 "schema_to_select must be provided when return_as_model is True."
             )
-        return schema_to_select(**out)
+        if self._can_construct(schema_to_select):
+            return _construct_rows(schema_to_select, (result._mapping,))[0]
+        if schema_to_select.model_config.get("strict", False):
+            return schema_to_select.model_validate(dict(result._mapping))
+        return schema_to_select.model_validate(result._mapping)
 
     def _as_multi_response(
         self,
@@ -2285,24 +4212,15 @@ class FastCRUD(
         schema_to_select: Optional[type[SelectSchemaType]] = None,
         return_as_model: bool = False,
     ) -> dict:
-        data = [dict(row) for row in db_row.mappings()]
-
-        response: dict[str, Any] = {"data": data}
-
         if return_as_model:
             if not schema_to_select:  # pragma: no cover
                 raise ValueError(
                     "schema_to_select must be provided when return_as_model is True."
                 )
-            try:
-                model_data = [schema_to_select(**row) for row in data]
-                response["data"] = model_data
-            except ValidationError as e:  # pragma: no cover
-                raise ValueError(
-                    f"Data validation error for schema {schema_to_select.__name__}: {e}"
-                )
+            return {"data": self._validate_rows(db_row.mappings(), schema_to_select)}
 
-        return response
+        keys = tuple(db_row.keys())
+        return {"data": [dict(zip(keys, row)) for row in db_row]}
 
     async def db_delete(
         self,
@@ -2355,13 +4273,18 @@ class FastCRUD(
             )
             ```
         """
-        if not allow_multiple and (total_count := await self.count(db, **kwargs)) > 1:
+        if (
+            not allow_multiple
+            and kwargs.keys() != self._primary_key_names
+            and await self._count_up_to_two(db, kwargs) > 1
+        ):
             raise MultipleResultsFound(
-                f"Expected exactly one record to delete, found {total_count}."
+                "Expected exactly one record to delete, found more than one."
             )
 
-        filters = self._parse_filters(**kwargs)
-        stmt = delete(self.model).filter(*filters)
+        stmt = delete(self.model)
+        if kwargs:
+            stmt = stmt.filter(*self._parse_filters(**kwargs))
         await db.execute(stmt)
         if commit:
             await db.commit()
@@ -2373,10 +4296,14 @@ class FastCRUD(
         allow_multiple: bool = False,
         commit: bool = True,
         **kwargs: Any,
-    ) -> None:
+    ) -> int:
         """
         Soft deletes a record or optionally multiple records if it has an `"is_deleted"` attribute, otherwise performs a hard delete, based on specified filters.
 
+        With filters, the records are changed by a single `UPDATE` or `DELETE` statement, so ORM relationship cascades
+        don't run and related rows are left to the database's foreign key `ON DELETE` rules. A `db_row` is deleted
+        through the session instead, which applies the ORM cascades configured on the model.
+
         For filtering details see [the Advanced Filters documentation](../advanced/crud.md/#advanced-filters)
 
         Args:
@@ -2387,11 +4314,12 @@ class FastCRUD(
             **kwargs: Filters to identify the record(s) to delete, supporting advanced comparison operators for refined querying.
 
         Raises:
+            ValueError: If neither `db_row` nor any filter is provided. Use `delete_many` to delete every record on purpose.
             MultipleResultsFound: If `allow_multiple` is `False` and more than one record matches the filters.
             NoResultFound: If no record matches the filters.
 
         Returns:
-            None
+            The number of records deleted: `1` unless `allow_multiple` is `True`.
 
         Examples:
             Soft delete a specific user by ID:
@@ -2403,7 +4331,7 @@ class FastCRUD(
             Soft delete users with account registration dates before 2020, allowing deletion of multiple records:
 
             ```python
-            await user_crud.delete(
+            deleted_count = await user_crud.delete(
                 db,
                 allow_multiple=True,
                 creation_date__lt=datetime(2020, 1, 1),
@@ -2420,41 +4348,120 @@ class FastCRUD(
             )
             ```
         """
-        filters = self._parse_filters(**kwargs)
         if db_row:
-            if hasattr(db_row, self.is_deleted_column) and hasattr(
-                db_row, self.deleted_at_column
-            ):
+            if self._has_soft_delete_attrs:
                 setattr(db_row, self.is_deleted_column, True)
                 setattr(db_row, self.deleted_at_column, datetime.now(timezone.utc))
-                if commit:
-                    await db.commit()
             else:
                 await db.delete(db_row)
             if commit:
                 await db.commit()
-            return
+            return 1
 
-        total_count = await self.count(db, **kwargs)
-        if total_count == 0:
-            raise NoResultFound("No record found to delete.")
-        if not allow_multiple and total_count > 1:
-            raise MultipleResultsFound(
-                f"Expected exactly one record to delete, found {total_count}."
+        if not kwargs:
+            raise ValueError(
+                "delete requires db_row or at least one filter; use delete_many to delete every record."
             )
 
+        stmt, params = self._get_delete_statement(
+            kwargs,
+            single_match=not allow_multiple
+            and kwargs.keys() != self._primary_key_names,
+        )
+        result = cast(CursorResult, await db.execute(stmt, params))
+        if result.rowcount == 0:
+            if not allow_multiple and await self._count_up_to_two(db, kwargs) > 1:
+                raise MultipleResultsFound(
+                    "Expected exactly one record to delete, found more than one."
+                )
+            raise NoResultFound("No record found to delete.")
+
+        if commit:
+            await db.commit()
+        return result.rowcount
+
+    async def delete_many(
+        self,
+        db: AsyncSession,
+        commit: bool = True,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Soft deletes, or hard deletes if the model has no soft delete columns, every record matching the filters with a single statement.
+
+        Unlike `delete`, no record needs to match and no match check is made, so this is the cheapest way to purge records in bulk.
+        Without filters, every record of the model is deleted.
+
+        For filtering details see [the Advanced Filters documentation](../advanced/crud.md/#advanced-filters)
+
+        Args:
+            db: The database session to use for the operation.
+            commit: If `True`, commits the transaction immediately. Default is `True`.
+            **kwargs: Filters to identify the records to delete, supporting advanced comparison operators for refined querying.
+
+        Returns:
+            The number of records deleted.
+
+        Examples:
+            Soft delete every user inactive since 2020:
+
+            ```python
+            deleted = await user_crud.delete_many(db, last_login__lt=datetime(2020, 1, 1))
+            ```
+        """
+        stmt, params = self._get_delete_statement(kwargs, single_match=False)
+        result = cast(CursorResult, await db.execute(stmt, params))
+        if commit:
+            await db.commit()
+        return result.rowcount
+
+    def _get_delete_statement(
+        self, filters: dict[str, Any], single_match: bool
+    ) -> tuple[Executable, dict[str, Any]]:
+        """
+        Returns the statement `delete` and `delete_many` run for the records matching `filters`, and its bind parameters.
+
+        The hard delete `DELETE` is a Core statement, so it is cached per filter shape like the read statements. The soft
+        delete `UPDATE` is built on every call: it is ORM-enabled, and the session synchronizes loaded instances by
+        evaluating its criteria with the values stored in the statement, not the execution parameters.
+
+        Args:
+            filters: Filters in the same format accepted by `_parse_filters`.
+            single_match: Whether to add `_single_match_condition`, so the statement affects no row if several match.
+
+        Returns:
+            A `(statement, params)` tuple: an `UPDATE` setting the soft delete columns the model has, or a `DELETE` if it has neither.
+        """
         update_values: dict[str, Union[bool, datetime]] = {}
-        if self.deleted_at_column in self.model_col_names:
+        if self._has_deleted_at_column:
             update_values[self.deleted_at_column] = datetime.now(timezone.utc)
-        if self.is_deleted_column in self.model_col_names:
+        if self._has_is_deleted_column:
             update_values[self.is_deleted_column] = True
 
-        if update_values:
-            update_stmt = update(self.model).filter(*filters).values(**update_values)
-            await db.execute(update_stmt)
+        def build(use_bind_params: bool) -> Executable:
+            parsed_filters = (
+                self._parse_bound_filters(_FILTER_BIND_PREFIX, **filters)
+                if use_bind_params
+                else self._parse_filters(**filters)
+            )
+            if single_match:
+                parsed_filters.append(self._single_match_condition(parsed_filters))
+            if update_values:
+                return (
+                    update(self.model).filter(*parsed_filters).values(**update_values)
+                )
+            stmt: Executable = self.model.__table__.delete().where(*parsed_filters)
+            return stmt
 
-        else:
-            delete_stmt = self.model.__table__.delete().where(*filters)
-            await db.execute(delete_stmt)
-        if commit:
-            await db.commit()
+        filter_binds = (
+            None
+            if update_values
+            else self._get_filter_binds(_FILTER_BIND_PREFIX, filters)
+        )
+        if filter_binds is None:
+            return build(use_bind_params=False), {}
+
+        return self._get_cached_statement(
+            ("delete", single_match, filter_binds[0]),
+            lambda: build(use_bind_params=True),
+        ), filter_binds[1]
@@ -1,9 +1,37 @@
-from typing import Any, Optional, Union, Sequence, cast
+import base64
+import binascii
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Hashable,
+    Iterable,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+    Sequence,
+    cast,
+    get_args,
+    get_origin,
+)
 
 from sqlalchemy import inspect
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql import ColumnElement
-from pydantic import BaseModel, ConfigDict
+from sqlalchemy.sql.elements import ClauseElement
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    RootModel,
+    TypeAdapter,
+    ValidationError,
+)
+from pydantic_core import from_json, to_json
 from pydantic.functional_validators import field_validator
 
 from fastcrud.types import ModelType, SelectSchemaType
@@ -64,6 +92,28 @@ def _extract_matching_columns_from_schema(
         in the schema or all columns from the model if no schema is specified. These columns are correctly referenced
         through the provided alias if one is given.
     """
+    return list(
+        _get_matching_columns(
+            model, schema, prefix, alias, use_temporary_prefix, temp_prefix
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_matching_columns(
+    model: Union[ModelType, AliasedClass],
+    schema: Optional[type[SelectSchemaType]],
+    prefix: Optional[str],
+    alias: Optional[AliasedClass],
+    use_temporary_prefix: Optional[bool],
+    temp_prefix: Optional[str],
+) -> tuple[Any, ...]:
+    """
+    Cached implementation of `_extract_matching_columns_from_schema`.
+
+    Column expressions are immutable, so the same labeled columns can be shared by every statement built for a
+    given model, schema, prefix and alias.
+    """
     if not hasattr(model, "__table__"):  # pragma: no cover
         raise AttributeError(f"{model.__name__} does not have a '__table__' attribute.")
 
@@ -99,7 +149,231 @@ def _extract_matching_columns_from_schema(
                 column = column.label(column_label)
             columns.append(column)
 
-    return columns
+    return tuple(columns)
+
+
+@lru_cache(maxsize=256)
+def _get_schema_input_keys(schema: type[BaseModel]) -> Optional[frozenset[str]]:
+    """
+    Gets the input keys a Pydantic schema reads when validating a dictionary.
+
+    Args:
+        schema: The Pydantic schema.
+
+    Returns:
+        The field names and aliases of the schema, including the top-level keys of `AliasChoices` and `AliasPath`
+        validation aliases, or `None` if every input key may matter: when the schema keeps or rejects extra keys
+        (`extra="allow"` or `extra="forbid"`), or has a `before` or `wrap` model validator, which sees the raw input.
+    """
+    if schema.model_config.get("extra", "ignore") != "ignore":
+        return None
+    if any(
+        decorator.info.mode in ("before", "wrap")
+        for decorator in schema.__pydantic_decorators__.model_validators.values()
+    ):
+        return None
+
+    keys = set()
+    for name, field in schema.model_fields.items():
+        keys.add(name)
+        if field.alias:
+            keys.add(field.alias)
+        validation_alias = field.validation_alias
+        choices: list[Any] = (
+            list(validation_alias.choices)
+            if isinstance(validation_alias, AliasChoices)
+            else [validation_alias]
+        )
+        for choice in choices:
+            key = choice.path[0] if isinstance(choice, AliasPath) else choice
+            if isinstance(key, str):
+                keys.add(key)
+            elif key is not None:
+                return None
+
+    return frozenset(keys)
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """
+    Checks whether values of a field annotation are returned unchanged by `model_dump`.
+
+    Args:
+        annotation: The field annotation.
+
+    Returns:
+        `False` if the annotation may hold nested models, dataclasses, typed dicts or untyped containers, which
+        `model_dump` converts, `True` otherwise.
+    """
+    origin = get_origin(annotation)
+    if origin is None:
+        if annotation is None or annotation is type(None):
+            return True
+        if not isinstance(annotation, type) or annotation in (
+            object,
+            list,
+            tuple,
+            set,
+            frozenset,
+            dict,
+        ):
+            return False
+        return not (
+            issubclass(annotation, (BaseModel, Mapping)) or is_dataclass(annotation)
+        )
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        return _is_plain_annotation(get_args(annotation)[0])
+
+    return all(
+        _is_plain_annotation(arg) for arg in get_args(annotation) if arg is not Ellipsis
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_dump_fields(schema: type[BaseModel]) -> Optional[tuple[str, ...]]:
+    """
+    Gets the fields of a Pydantic schema that can be read from an instance instead of calling `model_dump`.
+
+    Args:
+        schema: The Pydantic schema.
+
+    Returns:
+        The field names, or `None` if `model_dump` may return something other than the field values (e.g. nested
+        models, serializers, computed or excluded fields, or extra values).
+    """
+    decorators = schema.__pydantic_decorators__
+    if (
+        issubclass(schema, RootModel)
+        or schema.model_config.get("extra") == "allow"
+        or schema.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+    ):
+        return None
+
+    for field in schema.model_fields.values():
+        if field.exclude or not _is_plain_annotation(field.annotation):
+            return None
+
+    return tuple(schema.model_fields)
+
+
+@lru_cache(maxsize=256)
+def _get_construct_fields(schema: type[BaseModel]) -> Optional[tuple[str, ...]]:
+    """
+    Gets the fields of a Pydantic schema whose instances `_construct_rows` can build by setting their state directly.
+
+    Args:
+        schema: The Pydantic schema.
+
+    Returns:
+        The field names, or `None` if `model_construct` does more than storing the field values (e.g. for aliases,
+        private attributes, `model_post_init` or a custom `__new__`, as SQLModel has).
+    """
+    field_names = _get_dump_fields(schema)
+    if (
+        field_names is None
+        or schema.__new__ is not BaseModel.__new__
+        or schema.model_construct.__func__ is not BaseModel.model_construct.__func__  # type: ignore[attr-defined]
+        or schema.__pydantic_post_init__ is not None
+        or schema.__private_attributes__
+        or any(field.alias for field in schema.model_fields.values())
+    ):
+        return None
+    return field_names
+
+
+def _construct_rows(
+    schema: type[SelectSchemaType], rows: Iterable[Mapping[Any, Any]]
+) -> list[SelectSchemaType]:
+    """
+    Builds `schema` instances from rows without validation, with the same result as `schema.model_construct(**row)`.
+
+    For schemas `_get_construct_fields` accepts, the instance state is set directly instead of going through
+    `model_construct`'s keyword handling, which is several times faster per row.
+
+    Args:
+        schema: The Pydantic schema to build instances of.
+        rows: The rows, as dictionaries or SQLAlchemy `RowMapping` objects.
+
+    Returns:
+        The schema instances.
+    """
+    field_names = _get_construct_fields(schema)
+    if field_names is None:
+        return [schema.model_construct(**row) for row in rows]
+
+    fields_set = frozenset(field_names)
+    new = schema.__new__
+    set_attribute = object.__setattr__
+    instances = []
+    for row in rows:
+        try:
+            values = {name: row[name] for name in field_names}
+        except KeyError:
+            instances.append(schema.model_construct(**row))
+            continue
+        instance = new(schema)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__pydantic_fields_set__", fields_set)
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        instances.append(instance)
+    return instances
+
+
+def _dump_schema(object: BaseModel) -> dict[str, Any]:
+    """
+    Converts a Pydantic schema instance into the keyword arguments for a model constructor.
+
+    Args:
+        object: The Pydantic schema instance.
+
+    Returns:
+        The same dictionary as `object.model_dump()`, built from the field values directly when that is equivalent.
+    """
+    field_names = _get_dump_fields(type(object))
+    if field_names is None:
+        return object.model_dump()
+
+    values = object.__dict__
+    return {name: values[name] for name in field_names}
+
+
+def _is_sql_expression(value: Any) -> bool:
+    """
+    Checks whether a filter value is a SQL expression (e.g. a column) rather than a plain value.
+
+    Args:
+        value: The filter value.
+
+    Returns:
+        `True` if the value is a SQLAlchemy clause element or can be coerced into one.
+    """
+    return isinstance(value, ClauseElement) or hasattr(value, "__clause_element__")
+
+
+def _get_statement_key(clause: Any) -> Optional[Hashable]:
+    """
+    Builds a key that identifies a SQL expression, including the values of its bound parameters.
+
+    Args:
+        clause: A SQLAlchemy expression, such as a join condition.
+
+    Returns:
+        A key for the expression, or `None` if SQLAlchemy can't generate a cache key for it.
+    """
+    generate_cache_key = getattr(clause, "_generate_cache_key", None)
+    if generate_cache_key is None:
+        return None
+
+    cache_key = generate_cache_key()
+    if cache_key is None:
+        return None
+
+    return cache_key.key, tuple(bind.effective_value for bind in cache_key.bindparams)
 
 
 def _auto_detect_join_condition(
@@ -120,6 +394,15 @@ def _auto_detect_join_condition(
         ValueError: If the join condition cannot be automatically determined.
         AttributeError: If either base_model or join_model does not have a `__table__` attribute.
     """
+    return _detect_join_condition(base_model, join_model)
+
+
+@lru_cache(maxsize=128)
+def _detect_join_condition(
+    base_model: ModelType,
+    join_model: ModelType,
+) -> Optional[ColumnElement]:
+    """Cached implementation of `_auto_detect_join_condition`, as the condition only depends on the two models."""
     if not hasattr(base_model, "__table__"):  # pragma: no cover
         raise AttributeError(
             f"{base_model.__name__} does not have a '__table__' attribute."
@@ -289,11 +572,102 @@ def _handle_one_to_many(nested_data, nested_key, nested_field, value):
     return nested_data
 
 
+class _JoinNesting(NamedTuple):
+    """How the columns of one join are nested, resolved once per query instead of once per row."""
+
+    prefix: str
+    nested_key: str
+    one_to_many: bool
+    primary_key: Optional[str]
+
+
+def _get_join_nestings(
+    join_definitions: Sequence[JoinConfig], temp_prefix: str = "joined__"
+) -> tuple[_JoinNesting, ...]:
+    """
+    Resolves the prefix, nested key, relationship type and primary key of each join for `_nest_join_data`.
+
+    Args:
+        join_definitions: A list of `JoinConfig` instances defining the join configurations, including prefixes.
+        temp_prefix: The temporary prefix applied to joined columns to differentiate them. Defaults to `"joined__"`.
+
+    Returns:
+        A `_JoinNesting` for each join, in the order of `join_definitions`.
+    """
+    return tuple(
+        _JoinNesting(
+            prefix=f"{temp_prefix}{join.join_prefix or ''}",
+            nested_key=(
+                join.join_prefix.rstrip("_")
+                if join.join_prefix
+                else join.model.__tablename__
+            ),
+            one_to_many=join.relationship_type == "one-to-many",
+            primary_key=_get_primary_key(join.model),
+        )
+        for join in join_definitions
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_value_adapter(python_type: type) -> TypeAdapter:
+    """Returns a cached `TypeAdapter` converting JSON values back to `python_type`."""
+    return TypeAdapter(python_type)
+
+
+@lru_cache(maxsize=256)
+def _get_list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Returns a cached `TypeAdapter` validating a list of dictionaries into `schema` instances in one call."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the sort key values of a row into an opaque, URL-safe keyset pagination cursor.
+
+    Args:
+        values: The values of the keyset columns, in keyset order.
+
+    Returns:
+        The cursor string.
+    """
+    return base64.urlsafe_b64encode(to_json(list(values))).decode()
+
+
+def _decode_cursor(cursor: str, python_types: Sequence[Optional[type]]) -> list[Any]:
+    """
+    Decodes a cursor created by `_encode_cursor`, converting each value back to the Python type of its column.
+
+    Args:
+        cursor: The cursor string.
+        python_types: The Python type of each keyset column, or `None` to keep the decoded JSON value as is.
+
+    Returns:
+        The keyset column values, in keyset order.
+
+    Raises:
+        ValueError: If the cursor is malformed or doesn't match the keyset columns.
+    """
+    try:
+        values = from_json(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(python_types):
+            raise ValueError
+        return [
+            value
+            if python_type is None or value is None
+            else _get_value_adapter(python_type).validate_python(value)
+            for python_type, value in zip(python_types, values)
+        ]
+    except (ValueError, binascii.Error, ValidationError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
 def _nest_join_data(
-    data: dict,
-    join_definitions: list[JoinConfig],
+    data: Mapping[str, Any],
+    join_definitions: Sequence[JoinConfig],
     temp_prefix: str = "joined__",
     nested_data: Optional[dict[str, Any]] = None,
+    join_nestings: Optional[Sequence[_JoinNesting]] = None,
 ) -> dict:
     """
     Nests joined data based on join definitions provided. This function processes the input `data` dictionary, identifying keys
@@ -304,6 +678,7 @@ def _nest_join_data(
         join_definitions: A list of `JoinConfig` instances defining the join configurations, including prefixes.
         temp_prefix: The temporary prefix applied to joined columns to differentiate them. Defaults to `"joined__"`.
         nested_data: The nested dictionary to which the data will be added. If None, a new dictionary is created. Defaults to `None`.
+        join_nestings: The result of `_get_join_nestings` for `join_definitions`, to avoid resolving it again for every row. Defaults to `None`.
 
     Returns:
         dict[str, Any]: A dictionary with nested structures for joined table data.
@@ -380,20 +755,17 @@ def _nest_join_data(
     """
     if nested_data is None:
         nested_data = {}
+    if join_nestings is None:
+        join_nestings = _get_join_nestings(join_definitions, temp_prefix)
 
     for key, value in data.items():
         nested = False
-        for join in join_definitions:
-            join_prefix = join.join_prefix or ""
-            full_prefix = f"{temp_prefix}{join_prefix}"
-
-            if isinstance(key, str) and key.startswith(full_prefix):
-                nested_key = (
-                    join_prefix.rstrip("_") if join_prefix else join.model.__tablename__
-                )
-                nested_field = key[len(full_prefix) :]
+        for join_nesting in join_nestings:
+            if isinstance(key, str) and key.startswith(join_nesting.prefix):
+                nested_key = join_nesting.nested_key
+                nested_field = key[len(join_nesting.prefix) :]
 
-                if join.relationship_type == "one-to-many":
+                if join_nesting.one_to_many:
                     nested_data = _handle_one_to_many(
                         nested_data, nested_key, nested_field, value
                     )
@@ -419,14 +791,10 @@ def _nest_join_data(
     if nested_data is None:  # pragma: no cover
         nested_data = {}
 
-    for join in join_definitions:
-        join_primary_key = _get_primary_key(join.model)
-        nested_key = (
-            join.join_prefix.rstrip("_")
-            if join.join_prefix
-            else join.model.__tablename__
-        )
-        if join.relationship_type == "one-to-many" and nested_key in nested_data:
+    for join_nesting in join_nestings:
+        join_primary_key = join_nesting.primary_key
+        nested_key = join_nesting.nested_key
+        if join_nesting.one_to_many and nested_key in nested_data:
             if isinstance(nested_data.get(nested_key, []), list):
                 if any(
                     item[join_primary_key] is None for item in nested_data[nested_key]
@@ -592,17 +960,15 @@ def _nest_multi_join_data(
                 "schema_to_select must be provided when return_as_model is True."
             )
 
-        converted_data = []
-        for item in nested_data:
-            if nested_schema_to_select:
+        if nested_schema_to_select:
+            for item in nested_data:
                 for prefix, nested_schema in nested_schema_to_select.items():
                     prefix_key = prefix.rstrip("_")
                     if prefix_key in item:
                         if isinstance(item[prefix_key], list):
-                            item[prefix_key] = [
-                                nested_schema(**nested_item)
-                                for nested_item in item[prefix_key]
-                            ]
+                            item[prefix_key] = _get_list_adapter(
+                                nested_schema
+                            ).validate_python(item[prefix_key])
                         else:  # pragma: no cover
                             item[prefix_key] = (
                                 nested_schema(**item[prefix_key])
@@ -610,7 +976,9 @@ def _nest_multi_join_data(
                                 else None
                             )
 
-            converted_data.append(schema_to_select(**item))
+        converted_data: list[SelectSchemaType] = _get_list_adapter(
+            schema_to_select
+        ).validate_python(nested_data)
         return converted_data
 
     return nested_data
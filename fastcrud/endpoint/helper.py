@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 from uuid import UUID
 from typing import Optional, Union, Annotated, Sequence, Callable, TypeVar, Any
 
@@ -71,6 +72,7 @@ class FilterConfig(BaseModel):
         return params
 
 
+@lru_cache(maxsize=None)
 def _get_primary_key(
     model: ModelType,
 ) -> Union[str, None]:  # pragma: no cover
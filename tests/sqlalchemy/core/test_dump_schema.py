@@ -0,0 +1,110 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
+
+from fastcrud.crud.helper import (
+    _construct_rows,
+    _dump_schema,
+    _get_construct_fields,
+    _get_dump_fields,
+)
+
+
+class AddressSchema(BaseModel):
+    city: str
+
+
+class NestedSchema(BaseModel):
+    name: str
+    addresses: list[AddressSchema]
+
+
+class UntypedSchema(BaseModel):
+    name: str
+    meta: dict
+
+
+class SerializedSchema(BaseModel):
+    name: str
+
+    @field_serializer("name")
+    def serialize_name(self, name: str) -> str:
+        return name.upper()
+
+
+class ExtraSchema(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+
+
+class OptionalSchema(BaseModel):
+    name: str
+    tags: Optional[list[str]] = None
+
+
+def test_dump_schema_reads_plain_fields(create_schema):
+    item = create_schema(name="Plain", tier_id=1)
+    assert _get_dump_fields(create_schema) is not None
+    assert _dump_schema(item) == item.model_dump()
+
+    item = OptionalSchema(name="Tagged", tags=["a"])
+    assert _get_dump_fields(OptionalSchema) == ("name", "tags")
+    assert _dump_schema(item) == {"name": "Tagged", "tags": ["a"]}
+
+
+def test_dump_schema_falls_back_to_model_dump():
+    items = [
+        NestedSchema(name="Nested", addresses=[AddressSchema(city="Lisbon")]),
+        UntypedSchema(name="Untyped", meta={"address": AddressSchema(city="Porto")}),
+        SerializedSchema(name="serialized"),
+        ExtraSchema(name="Extra", nickname="extra"),
+    ]
+    for item in items:
+        assert _get_dump_fields(type(item)) is None
+        assert _dump_schema(item) == item.model_dump()
+
+    assert _dump_schema(items[0]) == {
+        "name": "Nested",
+        "addresses": [{"city": "Lisbon"}],
+    }
+
+
+class AliasedSchema(BaseModel):
+    name: str = Field(alias="display_name")
+
+
+class PrivateSchema(BaseModel):
+    name: str
+    _cache: dict = PrivateAttr(default_factory=dict)
+
+
+def test_construct_rows_matches_model_construct(create_schema):
+    rows = [
+        {"name": "First", "tier_id": 1, "unselected": True},
+        {"name": "Second", "tier_id": 2},
+    ]
+    assert _get_construct_fields(create_schema) is not None
+
+    constructed = _construct_rows(create_schema, rows)
+    expected = [create_schema.model_construct(**row) for row in rows]
+    assert constructed == expected
+    assert [item.model_fields_set for item in constructed] == [
+        item.model_fields_set for item in expected
+    ]
+
+    partial = _construct_rows(OptionalSchema, [{"name": "No Tags"}])
+    assert partial == [OptionalSchema.model_construct(name="No Tags")]
+
+
+def test_construct_rows_falls_back_to_model_construct():
+    for schema, row in (
+        (AliasedSchema, {"display_name": "Aliased"}),
+        (PrivateSchema, {"name": "Private"}),
+    ):
+        assert _get_construct_fields(schema) is None
+        (item,) = _construct_rows(schema, [row])
+        assert item == schema.model_construct(**row)
+
+    (item,) = _construct_rows(PrivateSchema, [{"name": "Private"}])
+    assert item._cache == {}
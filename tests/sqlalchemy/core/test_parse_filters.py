@@ -1,5 +1,7 @@
 import pytest
-from fastcrud import FastCRUD
+from sqlalchemy import select
+
+from fastcrud import FastCRUD, aliased
 
 
 @pytest.mark.asyncio
@@ -48,6 +50,18 @@ async def test_parse_filters_not_contained_in(test_model):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operator", ("in", "not_in"))
+async def test_parse_filters_in_shares_statement_shape(test_model, operator: str):
+    fast_crud = FastCRUD(test_model)
+    short_list = fast_crud._parse_filters(**{f"category_id__{operator}": [1, 2]})
+    long_list = fast_crud._parse_filters(**{f"category_id__{operator}": {1, 2, 3, 4}})
+
+    short_key = select(test_model.id).where(*short_list)._generate_cache_key()
+    long_key = select(test_model.id).where(*long_list)._generate_cache_key()
+    assert short_key.key == long_key.key
+
+
 @pytest.mark.asyncio
 async def test_parse_filters_between_condition(test_model):
     fast_crud = FastCRUD(test_model)
@@ -80,6 +94,31 @@ async def test_parse_filters_invalid_column(test_model):
         fast_crud._parse_filters(invalid_column__="This does not exist")
 
 
+@pytest.mark.asyncio
+async def test_parse_filters_unknown_column_without_operator(test_model):
+    fast_crud = FastCRUD(test_model)
+
+    with pytest.raises(ValueError) as exc:
+        fast_crud._parse_filters(name="John Doe", not_a_column=1)
+    assert str(exc.value) == "Invalid filter column: not_a_column"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters", [{"name__foo": 1}, {"name__or": {"like": "J%", "foo": 1}}]
+)
+async def test_parse_filters_unsupported_operator(test_model, filters):
+    fast_crud = FastCRUD(test_model)
+
+    with pytest.raises(ValueError) as exc:
+        fast_crud._parse_filters(**filters)
+    assert str(exc.value) == "Unsupported filter operator: foo"
+
+    with pytest.raises(ValueError) as exc:
+        fast_crud._get_filter_binds("fc_filter_", filters)
+    assert str(exc.value) == "Unsupported filter operator: foo"
+
+
 @pytest.mark.asyncio
 async def test_parse_filters_with_custom_column_names(test_model_custom_columns):
     fast_crud = FastCRUD(test_model_custom_columns)
@@ -98,3 +137,34 @@ async def test_parse_filters_with_custom_column_names(test_model_custom_columns)
     print(filter_str)
     assert any("test_custom.metadata LIKE" in f for f in filter_str)
     assert any("test_custom.display_name =" in f for f in filter_str)
+
+
+@pytest.mark.asyncio
+async def test_parse_filters_on_joined_model(test_model, tier_model):
+    fast_crud = FastCRUD(test_model)
+
+    filters = fast_crud._parse_filters(model=tier_model, name="Premium", id__gt=1)
+    assert [str(f) for f in filters] == ["tier.name = :name_1", "tier.id > :id_1"]
+    assert list(fast_crud._joined_filter_factories) == [tier_model]
+
+    tier_alias = aliased(tier_model, name="tier_alias")
+    filters = fast_crud._parse_filters(model=tier_alias, name="Premium")
+    assert [str(f) for f in filters] == ["tier_alias.name = :name_1"]
+    assert list(fast_crud._joined_filter_factories) == [tier_model]
+
+
+@pytest.mark.asyncio
+async def test_parse_filters_or_condition_on_joined_model(test_model, tier_model):
+    fast_crud = FastCRUD(test_model)
+
+    filters = fast_crud._parse_filters(
+        model=tier_model, name__or={"like": "Pre%", "in": ["Basic"]}
+    )
+    assert [str(f) for f in filters] == [
+        "tier.name LIKE :name_1 OR tier.name IN (__[POSTCOMPILE_name_2])"
+    ]
+    assert fast_crud._joined_columns[tier_model]["name"] is tier_model.name
+
+    with pytest.raises(ValueError) as exc:
+        fast_crud._parse_filters(model=tier_model, not_a_column__or={"gt": 1})
+    assert str(exc.value) == "Invalid filter column: not_a_column"
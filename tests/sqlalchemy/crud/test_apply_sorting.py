@@ -60,6 +60,29 @@ async def test_apply_sorting_multiple_columns_mixed_order(
     assert [item.name for item in sorted_data] == expected_sorted_names_mixed
 
 
+@pytest.mark.asyncio
+async def test_apply_sorting_tuple_columns_single_order(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    stmt = select(test_model)
+    sorted_stmt = crud._apply_sorting(stmt, ("tier_id", "id"), "desc")
+
+    result = await async_session.execute(sorted_stmt)
+    sorted_data = result.scalars().all()
+
+    sorted_data_manual = sorted(
+        test_data, key=lambda x: (x["tier_id"], x["id"]), reverse=True
+    )
+    assert [item.id for item in sorted_data] == [
+        item["id"] for item in sorted_data_manual
+    ]
+
+
 @pytest.mark.asyncio
 async def test_apply_sorting_invalid_column(async_session, test_model, test_data):
     for item in test_data:
@@ -111,3 +134,37 @@ async def test_apply_sorting_sort_orders_without_columns(async_session, test_mod
         str(exc_info.value)
         == "Sort orders provided without corresponding sort columns."
     )
+
+
+@pytest.mark.asyncio
+async def test_apply_sorting_reuses_sort_clauses(async_session, test_model):
+    crud = FastCRUD(test_model)
+    stmt = select(test_model)
+
+    first = crud._apply_sorting(stmt, ["name", "id"], ["desc", "asc"])
+    second = crud._apply_sorting(stmt, ["name", "id"], ["desc", "asc"])
+    assert list(crud._sort_clauses) == [("name", "desc"), ("id", "asc")]
+    assert [str(clause) for clause in second._order_by_clauses] == [
+        "test.name DESC",
+        "test.id ASC",
+    ]
+    assert all(
+        left is right
+        for left, right in zip(first._order_by_clauses, second._order_by_clauses)
+    )
+
+    with pytest.raises(ArgumentError):
+        crud._apply_sorting(stmt, "not_a_column")
+    assert ("not_a_column", "asc") not in crud._sort_clauses
+
+
+@pytest.mark.asyncio
+async def test_apply_sorting_invalid_order_not_cached(async_session, test_model):
+    crud = FastCRUD(test_model)
+    stmt = select(test_model)
+
+    crud._apply_sorting(stmt, "name", "asc")
+    with pytest.raises(ValueError) as exc:
+        crud._apply_sorting(stmt, ["name", "id"], ["asc", "up"])
+    assert str(exc.value) == "Invalid sort order: up. Only 'asc' or 'desc' are allowed."
+    assert list(crud._sort_clauses) == [("name", "asc")]
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event
 from fastcrud.crud.fast_crud import FastCRUD
 
 
@@ -50,3 +51,43 @@ async def test_exists_multiple_records_match(async_session, test_model, test_dat
     assert (
         exists is True
     ), "Should return True if multiple records match the filter criteria"
+
+
+@pytest.mark.asyncio
+async def test_exists_selects_no_model_columns(async_session, test_model, test_data):
+    crud = FastCRUD(test_model)
+    assert await crud.exists(async_session) is False
+
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        assert await crud.exists(async_session) is True
+        assert await crud.exists(async_session, tier_id=2) is True
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert all(statement.startswith("SELECT 1 \nFROM test") for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_exists_reuses_statement(async_session, test_model, test_data):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    for item in test_data[:3]:
+        assert await crud.exists(async_session, name=item["name"]) is True
+    assert await crud.exists(async_session, name="NonExistentName") is False
+    assert await crud.exists(async_session) is True
+
+    assert len(crud._statement_cache) == 2
@@ -1,8 +1,10 @@
 import pytest
 from typing import Annotated
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from fastcrud.crud.fast_crud import FastCRUD
-from sqlalchemy import select, func
+from sqlalchemy import event, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...sqlalchemy.conftest import _async_session, ModelTest
 
 
 class CustomCreateSchemaTest(BaseModel):
@@ -10,6 +12,10 @@ class CustomCreateSchemaTest(BaseModel):
     tier_id: int
 
 
+class StrictCustomCreateSchemaTest(CustomCreateSchemaTest):
+    model_config = ConfigDict(strict=True)
+
+
 @pytest.mark.asyncio
 async def test_get_multi_basic(async_session, test_model, test_data):
     for item in test_data:
@@ -246,3 +252,325 @@ async def test_get_multi_handle_validation_error(async_session, test_model):
     assert "Data validation error for schema CustomCreateSchemaTest:" in str(
         exc_info.value
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "schema", (CustomCreateSchemaTest, StrictCustomCreateSchemaTest)
+)
+async def test_get_multi_return_as_model_from_row_mappings(
+    async_session, test_model, test_data, schema
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    result = await crud.get_multi(
+        async_session, limit=3, return_as_model=True, schema_to_select=schema
+    )
+
+    assert [type(item) for item in result["data"]] == [schema] * 3
+    assert [item.name for item in result["data"]] == [
+        item["name"] for item in test_data[:3]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_multi_total_count_in_single_query(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        last_page = await crud.get_multi(async_session, offset=8, limit=5)
+        first_page = await crud.get_multi(async_session, limit=len(test_data) + 1)
+        full_page = await crud.get_multi(async_session, limit=2)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 3
+    assert last_page["total_count"] == len(test_data)
+    assert len(last_page["data"]) == len(test_data) - 8
+    assert first_page["total_count"] == len(test_data)
+    assert full_page["total_count"] == len(test_data)
+    assert "fc_total_count" not in full_page["data"][0]
+
+    past_the_end = await crud.get_multi(async_session, offset=len(test_data) + 5)
+    assert past_the_end["data"] == []
+    assert past_the_end["total_count"] == len(test_data)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_total_count_with_zero_limit(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    result = await crud.get_multi(async_session, limit=0)
+    assert result["data"] == []
+    assert result["total_count"] == len(test_data)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sort_columns, sort_orders",
+    (
+        ("name", None),
+        ("name", "desc"),
+        (["tier_id", "name"], ["desc", "asc"]),
+    ),
+)
+async def test_get_multi_keyset_pagination(
+    async_session, test_model, test_data, sort_columns, sort_orders
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    expected = await crud.get_multi(
+        async_session,
+        limit=None,
+        sort_columns=[sort_columns, "id"]
+        if isinstance(sort_columns, str)
+        else [*sort_columns, "id"],
+        sort_orders=[sort_orders or "asc"] * 2
+        if not isinstance(sort_orders, list)
+        else [*sort_orders, sort_orders[-1]],
+    )
+
+    pages = []
+    cursor = None
+    while True:
+        page = await crud.get_multi(
+            async_session,
+            limit=4,
+            sort_columns=sort_columns,
+            sort_orders=sort_orders,
+            use_keyset=True,
+            cursor=cursor,
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [len(page["data"]) for page in pages] == [4, 4, 3]
+    assert [item["id"] for page in pages for item in page["data"]] == [
+        item["id"] for item in expected["data"]
+    ]
+    assert all(page["total_count"] == len(test_data) for page in pages)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_keyset_pagination_zero_limit(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    result = await crud.get_multi(
+        async_session, limit=0, sort_columns="name", use_keyset=True
+    )
+    assert result == {"data": [], "total_count": len(test_data), "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_get_multi_keyset_pagination_invalid_arguments(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+
+    with pytest.raises(ValueError) as exc_info:
+        await crud.get_multi(async_session, offset=2, use_keyset=True)
+    assert "offset can't be used with use_keyset" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        await crud.get_multi(async_session, use_keyset=True, cursor="not-a-cursor")
+    assert str(exc_info.value) == "Invalid cursor: not-a-cursor"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_keyset", (False, True))
+async def test_get_multi_parallel_count(tmp_path, test_data, use_keyset):
+    async with _async_session(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'parallel_count.db'}"
+    ) as session:
+        for item in test_data:
+            session.add(ModelTest(**item))
+        await session.commit()
+
+        crud = FastCRUD(ModelTest)
+        kwargs = dict(limit=3, sort_columns="id", use_keyset=use_keyset, tier_id=1)
+        sequential = await crud.get_multi(session, **kwargs)
+        parallel = await crud.get_multi(session, parallel_count=True, **kwargs)
+
+    assert parallel == sequential
+    assert parallel["total_count"] == len(
+        [item for item in test_data if item["tier_id"] == 1]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_keyset", (False, True))
+async def test_get_multi_parallel_count_requires_engine(async_session, use_keyset):
+    crud = FastCRUD(ModelTest)
+    async with async_session.bind.connect() as connection:
+        async with AsyncSession(connection) as session:
+            with pytest.raises(ValueError) as exc_info:
+                await crud.get_multi(
+                    session, use_keyset=use_keyset, parallel_count=True
+                )
+
+    assert "parallel_count requires a session bound to an AsyncEngine" in str(
+        exc_info.value
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_multi_reuses_statement(async_session, test_data, test_model):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    for tier_id in (1, 2):
+        expected_ids = sorted(
+            item["id"] for item in test_data if item["tier_id"] == tier_id
+        )
+        for offset in (0, 2):
+            result = await crud.get_multi(
+                async_session,
+                offset=offset,
+                limit=2,
+                sort_columns="id",
+                tier_id=tier_id,
+            )
+            assert [item["id"] for item in result["data"]] == expected_ids[
+                offset : offset + 2
+            ]
+            assert result["total_count"] == len(expected_ids)
+
+        record = await crud.get(async_session, id=expected_ids[0])
+        assert record["tier_id"] == tier_id
+
+    assert len(crud._statement_cache) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_multi_stream(async_session, test_data, test_model):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    expected = await crud.get_multi(
+        async_session,
+        offset=1,
+        limit=None,
+        sort_columns="name",
+        sort_orders="desc",
+        return_total_count=False,
+        tier_id=1,
+    )
+
+    streamed = [
+        item
+        async for item in crud.get_multi_stream(
+            async_session,
+            offset=1,
+            sort_columns="name",
+            sort_orders="desc",
+            batch_size=2,
+            tier_id=1,
+        )
+    ]
+    assert streamed == expected["data"]
+
+    models = [
+        item
+        async for item in crud.get_multi_stream(
+            async_session,
+            schema_to_select=CustomCreateSchemaTest,
+            return_as_model=True,
+            sort_columns="id",
+            limit=3,
+            batch_size=2,
+        )
+    ]
+    assert all(isinstance(item, CustomCreateSchemaTest) for item in models)
+    assert [item.name for item in models] == [
+        item["name"] for item in sorted(test_data, key=lambda item: item["id"])[:3]
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"limit": -1},
+        {"offset": -1},
+        {"batch_size": 0},
+        {"return_as_model": True},
+    ),
+)
+async def test_get_multi_stream_invalid_arguments(async_session, test_model, kwargs):
+    crud = FastCRUD(test_model)
+    with pytest.raises(ValueError):
+        async for _ in crud.get_multi_stream(async_session, **kwargs):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_get_multi_trust_db_skips_validation(
+    async_session, test_data, test_model
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    trusted_crud = FastCRUD(test_model, trust_db=True)
+    kwargs = {
+        "schema_to_select": StrictCustomCreateSchemaTest,
+        "return_as_model": True,
+    }
+
+    expected = await crud.get_multi(async_session, sort_columns="id", **kwargs)
+    result = await trusted_crud.get_multi(async_session, sort_columns="id", **kwargs)
+    assert result == expected
+
+    first_id = min(item["id"] for item in test_data)
+    record = await trusted_crud.get(async_session, id=first_id, **kwargs)
+    assert record == expected["data"][0]
+
+    class TooLongName(BaseModel):
+        name: Annotated[str, Field(max_length=1)]
+
+    await trusted_crud.get_multi(
+        async_session, schema_to_select=TooLongName, return_as_model=True
+    )
+    with pytest.raises(ValueError):
+        await crud.get_multi(
+            async_session, schema_to_select=TooLongName, return_as_model=True
+        )
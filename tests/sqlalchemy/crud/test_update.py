@@ -1,8 +1,9 @@
 from datetime import datetime, timezone
 import pytest
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound
+from sqlalchemy.orm.exc import StaleDataError
 
 from fastcrud.crud.fast_crud import FastCRUD
 from ...sqlalchemy.conftest import ModelTest, UpdateSchemaTest, ModelTestWithTimestamp
@@ -275,3 +276,193 @@ async def test_update_with_returning(
     # Rollback the current transaction to see if the record was actually committed
     await async_session.rollback()
     assert await crud.count(async_session, name="Updated Name") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("return_columns", (None, ["id", "name"]))
+async def test_update_allow_multiple_single_statement(
+    async_session, test_data, return_columns
+):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        result = await crud.update(
+            async_session,
+            {"name": "Renamed"},
+            allow_multiple=True,
+            return_columns=return_columns,
+            tier_id=1,
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    expected_count = len([item for item in test_data if item["tier_id"] == 1])
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+    assert await crud.count(async_session, tier_id=1, name="Renamed") == expected_count
+    if return_columns:
+        assert len(result["data"]) == expected_count
+        assert {item["name"] for item in result["data"]} == {"Renamed"}
+
+    with pytest.raises(NoResultFound):
+        await crud.update(
+            async_session,
+            {"name": "Missing"},
+            allow_multiple=True,
+            return_columns=return_columns,
+            id=99999,
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_single_record_guard_stops_at_two_matches(
+    async_session, test_data
+):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        await crud.update(async_session, {"name": "Single"}, id=test_data[0]["id"])
+        with pytest.raises(MultipleResultsFound) as exc_info:
+            await crud.update(async_session, {"name": "Many"}, tier_id=1)
+        with pytest.raises(NoResultFound):
+            await crud.update(async_session, {"name": "None"}, id=99999)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert str(exc_info.value) == (
+        "Expected exactly one record to update, found more than one."
+    )
+    guards = [statement for statement in statements if statement.startswith("SELECT")]
+    assert len(guards) == 3
+    assert all("count(" not in guard and "LIMIT" in guard for guard in guards)
+    assert await crud.count(async_session, name="Many") == 0
+
+
+class UpdateSchemaWithId(UpdateSchemaTest):
+    id: int
+
+
+@pytest.mark.asyncio
+async def test_update_multi(async_session, test_data):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    loaded = await async_session.get(ModelTest, test_data[0]["id"])
+    statements: list[tuple[str, bool]] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, executemany))
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        await crud.update_multi(
+            async_session,
+            [
+                {"id": test_data[0]["id"], "name": "First"},
+                UpdateSchemaWithId(id=test_data[1]["id"], name="Second"),
+            ],
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 1
+    assert statements[0][0].startswith("UPDATE") and statements[0][1]
+    assert loaded.name == "First"
+    assert (await crud.get(async_session, id=test_data[1]["id"]))["name"] == "Second"
+    assert (await crud.get(async_session, id=test_data[2]["id"]))["name"] == (
+        test_data[2]["name"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_multi_sets_updated_at(async_session):
+    initial_time = datetime.now(timezone.utc)
+    records = [
+        ModelTestWithTimestamp(name=f"Initial {i}", updated_at=initial_time)
+        for i in range(2)
+    ]
+    async_session.add_all(records)
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTestWithTimestamp)
+    await crud.update_multi(
+        async_session,
+        [{"id": record.id, "name": f"Updated {i}"} for i, record in enumerate(records)],
+    )
+
+    result = await async_session.execute(
+        select(ModelTestWithTimestamp).order_by(ModelTestWithTimestamp.id)
+    )
+    updated = result.scalars().all()
+    assert [record.name for record in updated] == ["Updated 0", "Updated 1"]
+    assert all(record.updated_at > initial_time for record in updated)
+
+
+@pytest.mark.asyncio
+async def test_update_multi_invalid_objects(async_session, test_data):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    with pytest.raises(ValueError) as exc_info:
+        await crud.update_multi(async_session, [{"name": "No Key"}])
+    assert str(exc_info.value) == "Missing primary key values: ['id']"
+
+    with pytest.raises(ValueError) as exc_info:
+        await crud.update_multi(
+            async_session, [{"id": test_data[0]["id"], "not_a_column": 1}]
+        )
+    assert "Extra fields provided" in str(exc_info.value)
+
+    with pytest.raises(StaleDataError):
+        await crud.update_multi(async_session, [{"id": 99999, "name": "Missing"}])
+
+
+@pytest.mark.asyncio
+async def test_update_multi_custom_column_names(
+    async_session, test_model_custom_columns
+):
+    records = [
+        test_model_custom_columns(meta=f"meta {i}", name=f"Initial {i}")
+        for i in range(2)
+    ]
+    async_session.add_all(records)
+    await async_session.commit()
+
+    crud = FastCRUD(test_model_custom_columns)
+    await crud.update_multi(
+        async_session,
+        [{"id": record.id, "name": f"Updated {i}"} for i, record in enumerate(records)],
+    )
+    for i, record in enumerate(records):
+        assert (await crud.get(async_session, id=record.id))["name"] == f"Updated {i}"
+
+    with pytest.raises(ValueError) as exc_info:
+        await crud.update_multi(
+            async_session, [{"id": records[0].id, "display_name": "Column Name"}]
+        )
+    assert "Extra fields provided" in str(exc_info.value)
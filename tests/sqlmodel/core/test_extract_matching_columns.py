@@ -0,0 +1,28 @@
+from fastcrud.crud.helper import (
+    _auto_detect_join_condition,
+    _extract_matching_columns_from_schema,
+)
+from ...sqlmodel.conftest import ModelTest, ReadSchemaTest, TierModel
+
+
+def test_extract_matching_columns_returns_fresh_list():
+    columns = _extract_matching_columns_from_schema(
+        ModelTest, ReadSchemaTest, prefix="test_"
+    )
+    columns.clear()
+
+    columns_again = _extract_matching_columns_from_schema(
+        ModelTest, ReadSchemaTest, prefix="test_"
+    )
+    assert [column.key for column in columns_again] == [
+        f"test_{field}"
+        for field in ReadSchemaTest.model_fields
+        if hasattr(ModelTest, field)
+    ]
+
+
+def test_auto_detect_join_condition_is_reused():
+    join_on = _auto_detect_join_condition(ModelTest, TierModel)
+
+    assert _auto_detect_join_condition(ModelTest, TierModel) is join_on
+    assert str(join_on) == "test.tier_id = tier.id"
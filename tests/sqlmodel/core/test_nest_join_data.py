@@ -0,0 +1,39 @@
+from fastcrud import JoinConfig
+from fastcrud.crud.helper import _get_join_nestings, _nest_join_data
+from ...sqlmodel.conftest import Article, Card, TierModel
+
+
+def test_nest_join_data_with_precomputed_join_nestings():
+    join_definitions = [
+        JoinConfig(
+            model=Article,
+            join_on=Article.card_id == Card.id,
+            join_prefix="articles_",
+            relationship_type="one-to-many",
+        ),
+        JoinConfig(model=TierModel, join_on=None),
+    ]
+    join_nestings = _get_join_nestings(join_definitions)
+    assert [
+        (nesting.prefix, nesting.nested_key, nesting.one_to_many)
+        for nesting in join_nestings
+    ] == [("joined__articles_", "articles", True), ("joined__", "tier", False)]
+
+    rows = [
+        {"id": 1, "joined__articles_id": 10, "joined__articles_title": "First"},
+        {"id": 1, "joined__articles_id": 11, "joined__articles_title": "Second"},
+    ]
+    nested_data: dict = {}
+    for row in rows:
+        nested_data = _nest_join_data(
+            row, join_definitions, nested_data=nested_data, join_nestings=join_nestings
+        )
+    expected: dict = {}
+    for row in rows:
+        expected = _nest_join_data(row, join_definitions, nested_data=expected)
+
+    assert nested_data == expected
+    assert nested_data["articles"] == [
+        {"id": 10, "title": "First"},
+        {"id": 11, "title": "Second"},
+    ]
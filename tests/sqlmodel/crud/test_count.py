@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch
+from sqlalchemy import event, text
 from fastcrud.crud.fast_crud import FastCRUD
 from fastcrud import JoinConfig
 from ..conftest import Project, Participant, ProjectsParticipantsAssociation
@@ -17,6 +18,36 @@ async def test_count_no_filters(async_session, test_model, test_data):
     assert count == len(test_data)
 
 
+@pytest.mark.asyncio
+async def test_count_approximate_falls_back_to_exact_count(
+    async_session, test_model, test_data
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+
+    assert await crud.count(async_session, approximate=True) == len(test_data)
+    assert await crud.count(async_session, approximate=True, tier_id=1) == len(
+        [item for item in test_data if item["tier_id"] == 1]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.dialect("postgresql")
+async def test_count_approximate_uses_reltuples(async_session, test_model, test_data):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+    await async_session.execute(text(f"ANALYZE {test_model.__tablename__}"))
+
+    crud = FastCRUD(test_model)
+    count = await crud.count(async_session, approximate=True)
+
+    assert count == len(test_data)
+
+
 @pytest.mark.asyncio
 async def test_count_with_filters(async_session, test_model, test_data):
     for item in test_data:
@@ -101,9 +132,7 @@ async def test_count_with_joins_config_many_to_many(async_session):
         ),
     ]
 
-    count = await crud_project.count(
-        async_session, joins_config=joins_config, participant_id=1
-    )
+    count = await crud_project.count(async_session, joins_config=joins_config)
 
     assert (
         count == 2
@@ -165,3 +194,102 @@ async def test_count_raises_value_error_for_invalid_count(async_session):
         with pytest.raises(ValueError) as exc_info:
             await crud.count(async_session)
         assert str(exc_info.value) == "Could not find the count."
+
+
+@pytest.mark.asyncio
+async def test_count_reuses_statement(async_session, test_model, test_data):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    for tier_id in (1, 2):
+        assert await crud.count(async_session, tier_id=tier_id) == len(
+            [item for item in test_data if item["tier_id"] == tier_id]
+        )
+    for name in ("Alice", "Bob"):
+        assert await crud.count(async_session, name__in=[name]) == len(
+            [item for item in test_data if item["name"] == name]
+        )
+
+    assert len(crud._statement_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_count_unsupported_operator(async_session, test_model, test_data):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    with pytest.raises(ValueError) as exc_info:
+        await FastCRUD(test_model).count(async_session, name__foo=1)
+    assert str(exc_info.value) == "Unsupported filter operator: foo"
+
+
+@pytest.mark.asyncio
+async def test_count_operator_compared_to_none(async_session, test_model, test_data):
+    test_data[0]["category_id"] = None
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    assert await crud.count(async_session, category_id__ne=None) == len(test_data) - 1
+    assert (
+        await crud.count(async_session, category_id__or={"ne": None, "gt": 5})
+        == len(test_data) - 1
+    )
+    result = await crud.get_multi(async_session, category_id__ne=None, limit=None)
+    assert result["total_count"] == len(test_data) - 1
+    assert test_data[0]["id"] not in [item["id"] for item in result["data"]]
+
+
+@pytest.mark.asyncio
+async def test_count_with_joins_without_subquery(async_session):
+    project = Project(name="Project Zeta", description="Sixth Project")
+    participants = [
+        Participant(name="Sam Doe", role="Developer"),
+        Participant(name="Kim Doe", role="Developer"),
+    ]
+    async_session.add_all([project, *participants])
+    await async_session.commit()
+    async_session.add_all(
+        [
+            ProjectsParticipantsAssociation(
+                project_id=project.id, participant_id=participant.id
+            )
+            for participant in participants
+        ]
+    )
+    await async_session.commit()
+
+    joins_config = [
+        JoinConfig(
+            model=ProjectsParticipantsAssociation,
+            join_on=Project.id == ProjectsParticipantsAssociation.project_id,
+            join_type="inner",
+        ),
+        JoinConfig(
+            model=Participant,
+            join_on=ProjectsParticipantsAssociation.participant_id == Participant.id,
+            join_type="left",
+            filters={"role": "Developer"},
+        ),
+    ]
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        count = await FastCRUD(Project).count(
+            async_session, joins_config=joins_config, name="Project Zeta"
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert count == 2
+    (statement,) = statements
+    assert statement.count("SELECT") == 1
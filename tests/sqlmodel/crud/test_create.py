@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 from fastcrud.crud.fast_crud import FastCRUD
 from pydantic import ValidationError
 
@@ -80,3 +80,41 @@ async def test_create_successful_multi_pk(
     assert fetched_record.name == "New Record"
     assert fetched_record.id == 1
     assert fetched_record.uuid == "a"
+
+
+@pytest.mark.asyncio
+async def test_create_many(async_session, test_model, create_schema):
+    crud = FastCRUD(test_model)
+    objects = [create_schema(name=f"Bulk {i}", tier_id=1) for i in range(5)]
+    commits: list[object] = []
+
+    def record_commit(session):
+        commits.append(session)
+
+    sync_session = async_session.sync_session
+    event.listen(sync_session, "after_commit", record_commit)
+    try:
+        created = await crud.create_many(async_session, objects)
+    finally:
+        event.remove(sync_session, "after_commit", record_commit)
+
+    assert len(commits) == 1
+    assert [record.name for record in created] == [f"Bulk {i}" for i in range(5)]
+    assert all(record.id is not None for record in created)
+
+    result = await async_session.execute(
+        select(test_model.name).where(test_model.name.like("Bulk %"))
+    )
+    assert sorted(result.scalars()) == [f"Bulk {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_create_many_without_commit(async_session, test_model, create_schema):
+    crud = FastCRUD(test_model)
+    created = await crud.create_many(
+        async_session, [create_schema(name="Pending", tier_id=1)], commit=False
+    )
+
+    assert created[0] in async_session.new
+    await async_session.rollback()
+    assert await crud.count(async_session, name="Pending") == 0
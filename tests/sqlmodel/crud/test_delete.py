@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 from fastcrud.crud.fast_crud import FastCRUD
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound
 
@@ -195,3 +195,202 @@ async def test_delete_no_records_match_filters_raises_no_result_found(
 
     with pytest.raises(NoResultFound):
         await crud.delete(db=async_session, **non_matching_filter_criteria)
+
+
+@pytest.mark.asyncio
+async def test_delete_allow_multiple_single_statement(
+    async_session, test_data, test_model
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        deleted_count = await crud.delete(
+            db=async_session, allow_multiple=True, tier_id=1
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 1
+    assert deleted_count == len([item for item in test_data if item["tier_id"] == 1])
+    assert statements[0].startswith("UPDATE")
+    assert await crud.count(async_session, tier_id=1, is_deleted=True) == len(
+        [item for item in test_data if item["tier_id"] == 1]
+    )
+
+    with pytest.raises(NoResultFound):
+        await crud.delete(db=async_session, allow_multiple=True, id=99999)
+
+
+@pytest.mark.asyncio
+async def test_db_delete_removes_loaded_instance(
+    async_session, test_data_tier, tier_model
+):
+    for tier_item in test_data_tier:
+        async_session.add(tier_model(**tier_item))
+    await async_session.commit()
+
+    crud = FastCRUD(tier_model)
+    for tier_item in test_data_tier[:2]:
+        loaded = await async_session.get(tier_model, tier_item["id"])
+        assert loaded is not None
+
+        await crud.db_delete(db=async_session, id=tier_item["id"])
+
+        assert await async_session.get(tier_model, tier_item["id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_single_record_single_statement(
+    async_session, test_data, test_model, test_data_tier, tier_model
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    for tier_item in test_data_tier:
+        async_session.add(tier_model(**tier_item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    tier_crud = FastCRUD(tier_model)
+    loaded = await async_session.get(test_model, test_data[0]["id"])
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        await crud.delete(db=async_session, id=test_data[0]["id"], commit=False)
+        await tier_crud.delete(db=async_session, id=test_data_tier[0]["id"])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "DELETE"]
+    assert loaded.is_deleted is True
+    assert await tier_crud.get(async_session, id=test_data_tier[0]["id"]) is None
+
+    deleted_count = await crud.count(async_session, is_deleted=True)
+    with pytest.raises(MultipleResultsFound):
+        await crud.delete(db=async_session, tier_id=1)
+    assert await crud.count(async_session, is_deleted=True) == deleted_count
+
+    with pytest.raises(NoResultFound):
+        await crud.delete(db=async_session, id=99999)
+
+
+@pytest.mark.asyncio
+async def test_delete_many(
+    async_session, test_data, test_model, test_data_tier, tier_model
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    for tier_item in test_data_tier:
+        async_session.add(tier_model(**tier_item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        deleted = await crud.delete_many(async_session, tier_id=1)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    expected = len([item for item in test_data if item["tier_id"] == 1])
+    assert deleted == expected
+    assert len(statements) == 1 and statements[0].startswith("UPDATE")
+    assert await crud.count(async_session, tier_id=1, is_deleted=True) == expected
+
+    assert await crud.delete_many(async_session, id=99999) == 0
+
+    tier_crud = FastCRUD(tier_model)
+    assert await tier_crud.delete_many(async_session) == len(test_data_tier)
+    assert await tier_crud.count(async_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_by_primary_key_skips_match_check(
+    async_session, test_data, test_model
+):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        assert await crud.delete(db=async_session, id=test_data[0]["id"]) == 1
+        await crud.db_delete(db=async_session, id=test_data[1]["id"])
+        await crud.delete(db=async_session, name=test_data[2]["name"])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    statements = [
+        statement for statement in statements if not statement.startswith("COMMIT")
+    ]
+    assert len(statements) == 3
+    assert "count(" not in statements[0] and "count(" not in statements[1]
+    assert "count(" in statements[2]
+    assert await crud.exists(async_session, id=test_data[1]["id"]) is False
+
+    with pytest.raises(NoResultFound):
+        await crud.delete(db=async_session, id=99999)
+
+
+@pytest.mark.asyncio
+async def test_delete_without_filters_raises(async_session, test_data, test_model):
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(test_model)
+    for allow_multiple in (False, True):
+        with pytest.raises(ValueError) as exc_info:
+            await crud.delete(db=async_session, allow_multiple=allow_multiple)
+        assert "at least one filter" in str(exc_info.value)
+
+    assert await crud.count(async_session, is_deleted=True) == 0
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_reuses_statement(
+    async_session, test_data, test_model, test_data_tier, tier_model
+):
+    for tier_item in test_data_tier:
+        async_session.add(tier_model(**tier_item))
+    for item in test_data:
+        async_session.add(test_model(**item))
+    await async_session.commit()
+
+    tier_crud = FastCRUD(tier_model)
+    for tier_item in test_data_tier[:2]:
+        await tier_crud.delete(async_session, name=tier_item["name"])
+    assert await tier_crud.count(async_session) == len(test_data_tier) - 2
+    assert [key[:2] for key in tier_crud._statement_cache if key[0] == "delete"] == [
+        ("delete", True)
+    ]
+
+    crud = FastCRUD(test_model)
+    await crud.delete(async_session, id=test_data[0]["id"])
+    assert not any(key[0] == "delete" for key in crud._statement_cache)
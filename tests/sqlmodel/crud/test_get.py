@@ -1,5 +1,5 @@
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.exc import MultipleResultsFound
 
 from fastcrud.crud.fast_crud import FastCRUD
@@ -151,3 +151,27 @@ async def test_get_strict_existing_record(async_session, test_data):
 
     assert fetched_record is not None
     assert fetched_record["name"] == test_data[0]["name"]
+
+
+class StrictCreateSchemaTest(CreateSchemaTest):
+    model_config = ConfigDict(strict=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("schema", (CreateSchemaTest, StrictCreateSchemaTest))
+async def test_get_return_as_model_from_row_mapping(async_session, test_data, schema):
+    test_record = ModelTest(**test_data[0])
+    async_session.add(test_record)
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    fetched_model = await crud.get(
+        async_session, schema_to_select=schema, return_as_model=True, id=test_record.id
+    )
+
+    assert isinstance(fetched_model, schema)
+    assert fetched_model.name == test_data[0]["name"]
+    assert fetched_model.tier_id == test_data[0]["tier_id"]
+
+    fetched = await crud.get(async_session, schema_to_select=schema, id=test_record.id)
+    assert fetched == fetched_model.model_dump()
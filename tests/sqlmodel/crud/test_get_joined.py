@@ -714,3 +714,30 @@ async def test_get_joined_nested_data_none_dict(async_session):
     assert task3_result["client"] is None, "Task 3 should have no client."
     assert task3_result["department"] is None, "Task 3 should have no department."
     assert task3_result["assignee"] is None, "Task 3 should have no assignee."
+
+
+@pytest.mark.asyncio
+async def test_get_joined_reuses_statement(async_session, test_data, test_data_tier):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    tiers = {tier["id"]: tier["name"] for tier in test_data_tier}
+    for user_item in test_data[:3]:
+        result = await crud.get_joined(
+            db=async_session,
+            join_model=TierModel,
+            join_prefix="tier_",
+            schema_to_select=CreateSchemaTest,
+            join_schema_to_select=TierSchemaTest,
+            join_filters={"name__ne": "Unknown"},
+            id=user_item["id"],
+        )
+
+        assert result["name"] == user_item["name"]
+        assert result["tier_name"] == tiers[user_item["tier_id"]]
+
+    assert len(crud._statement_cache) == 1
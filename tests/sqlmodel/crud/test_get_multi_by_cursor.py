@@ -169,3 +169,71 @@ async def test_get_multi_by_cursor_desc_with_cursor_filter(async_session, test_d
         assert (
             record["id"] < first_page_last_id
         ), "Each ID in the second page should be less than the last ID of the first page"
+
+
+@pytest.mark.asyncio
+async def test_get_multi_by_cursor_reuses_statement(async_session, test_data):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    pages = []
+    cursor = None
+    while True:
+        page = await crud.get_multi_by_cursor(
+            db=async_session, cursor=cursor, limit=3, tier_id__in=[1, 2]
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    fetched_ids = [item["id"] for page in pages for item in page["data"]]
+    assert fetched_ids == sorted(
+        item["id"] for item in test_data if item["tier_id"] in (1, 2)
+    )
+    assert len(crud._statement_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_multi_by_cursor_desc_next_cursor(async_session, test_data):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    first_page = await crud.get_multi_by_cursor(
+        db=async_session, limit=3, sort_order="desc"
+    )
+    assert first_page["next_cursor"] == first_page["data"][-1]["id"]
+
+    second_page = await crud.get_multi_by_cursor(
+        db=async_session,
+        cursor=first_page["next_cursor"],
+        limit=3,
+        sort_order="desc",
+    )
+    assert [item["id"] for item in second_page["data"]] == [
+        first_page["next_cursor"] - offset for offset in range(1, 4)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_multi_by_cursor_exactly_full_last_page(async_session, test_data):
+    for item in test_data:
+        async_session.add(ModelTest(**item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    first_page = await crud.get_multi_by_cursor(
+        db=async_session, limit=len(test_data) - 2
+    )
+    assert len(first_page["data"]) == len(test_data) - 2
+    assert first_page["next_cursor"] == first_page["data"][-1]["id"]
+
+    last_page = await crud.get_multi_by_cursor(
+        db=async_session, cursor=first_page["next_cursor"], limit=2
+    )
+    assert len(last_page["data"]) == 2
+    assert last_page["next_cursor"] is None
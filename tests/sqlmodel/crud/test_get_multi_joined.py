@@ -1,12 +1,18 @@
+import json
 from typing import Annotated
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastcrud import FastCRUD, JoinConfig, aliased
-from pydantic import BaseModel, Field
+from fastcrud.crud.helper import _get_list_adapter
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 from ...sqlmodel.conftest import (
+    _setup_database,
     ModelTest,
     TierModel,
     CreateSchemaTest,
     TierSchemaTest,
+    TierDeleteSchemaTest,
     ReadSchemaTest,
     CategoryModel,
     CategorySchemaTest,
@@ -36,6 +42,25 @@ class JoinedTestTier(BaseModel):
     tier_name: str
 
 
+class StrictJoinedTestTier(JoinedTestTier):
+    model_config = ConfigDict(strict=True)
+
+
+class AliasChoicesJoinedTestTier(BaseModel):
+    name: str
+    tier: str = Field(validation_alias=AliasChoices("tier_label", "tier_name"))
+
+
+class BeforeValidatorJoinedTestTier(BaseModel):
+    name: str
+    tier: str
+
+    @model_validator(mode="before")
+    @classmethod
+    def read_tier_name(cls, data):
+        return {**data, "tier": data["tier_name"]}
+
+
 class CustomCreateSchemaTest(BaseModel):
     name: Annotated[str, Field(max_length=20)]
     tier_id: int
@@ -200,6 +225,9 @@ async def test_get_multi_joined_return_model(async_session, test_data, test_data
     )
 
     assert all(isinstance(item, JoinedTestTier) for item in result["data"])
+    misses = _get_list_adapter.cache_info().misses
+    _get_list_adapter(JoinedTestTier)
+    assert _get_list_adapter.cache_info().misses == misses
 
 
 @pytest.mark.asyncio
@@ -1015,7 +1043,6 @@ async def test_get_multi_joined_card_with_multiple_articles_as_models(async_sess
         nest_joins=True,
         return_as_model=True,
         schema_to_select=CardSchema,
-        nested_schema_to_select={"articles_": ArticleSchema},
         joins_config=[
             JoinConfig(
                 model=Article,
@@ -1359,3 +1386,761 @@ async def test_get_multi_joined_explicit_join_preserves_condition(async_session)
     assert (
         task3["department"]["name"] == "Engineering"
     ), "Task 3 should be in Engineering department"
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_parallel_count(tmp_path, test_data, test_data_tier):
+    async with _setup_database(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'parallel_count.db'}"
+    ) as session:
+        for tier_item in test_data_tier:
+            session.add(TierModel(**tier_item))
+        for user_item in test_data:
+            session.add(ModelTest(**user_item))
+        await session.commit()
+
+        crud = FastCRUD(ModelTest)
+        sequential = await crud.get_multi_joined(
+            db=session,
+            join_model=TierModel,
+            join_prefix="tier_",
+            schema_to_select=CreateSchemaTest,
+            join_schema_to_select=TierSchemaTest,
+            tier_id=1,
+            limit=3,
+        )
+        parallel = await crud.get_multi_joined(
+            db=session,
+            join_model=TierModel,
+            join_prefix="tier_",
+            schema_to_select=CreateSchemaTest,
+            join_schema_to_select=TierSchemaTest,
+            tier_id=1,
+            limit=3,
+            parallel_count=True,
+        )
+
+    assert parallel == sequential
+    assert parallel["total_count"] == len(
+        [item for item in test_data if item["tier_id"] == 1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_parallel_count_requires_engine(async_session):
+    crud = FastCRUD(ModelTest)
+    async with async_session.bind.connect() as connection:
+        async with AsyncSession(connection) as session:
+            with pytest.raises(ValueError) as exc_info:
+                await crud.get_multi_joined(
+                    db=session,
+                    join_model=TierModel,
+                    join_prefix="tier_",
+                    parallel_count=True,
+                )
+
+    assert "parallel_count requires a session bound to an AsyncEngine" in str(
+        exc_info.value
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_reuses_statement(
+    async_session, test_data, test_data_tier
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    for tier_id in (1, 2):
+        for offset in (0, 2):
+            result = await crud.get_multi_joined(
+                db=async_session,
+                join_model=TierModel,
+                join_prefix="tier_",
+                schema_to_select=ReadSchemaTest,
+                join_schema_to_select=TierSchemaTest,
+                sort_columns="id",
+                offset=offset,
+                limit=2,
+                tier_id=tier_id,
+            )
+
+            expected_ids = sorted(
+                item["id"] for item in test_data if item["tier_id"] == tier_id
+            )[offset : offset + 2]
+            assert [item["id"] for item in result["data"]] == expected_ids
+            assert all(item["tier_id"] == tier_id for item in result["data"])
+
+    joined_keys = [key for key in crud._statement_cache if key[0] == "get_multi_joined"]
+    assert len(joined_keys) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("schema", (JoinedTestTier, StrictJoinedTestTier))
+async def test_get_multi_joined_return_model_from_row_mappings(
+    async_session, test_data, test_data_tier, schema
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    result = await crud.get_multi_joined(
+        db=async_session,
+        join_model=TierModel,
+        schema_to_select=schema,
+        join_schema_to_select=TierSchemaTest,
+        join_prefix="tier_",
+        return_as_model=True,
+        sort_columns="id",
+    )
+
+    assert [item.name for item in result["data"]] == [
+        item["name"] for item in sorted(test_data, key=lambda item: item["id"])
+    ]
+    assert all(type(item) is schema for item in result["data"])
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_total_count_in_single_query(
+    async_session, test_data, test_data_tier
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    joins_config = [
+        JoinConfig(
+            model=TierModel,
+            join_prefix="tier_",
+            schema_to_select=TierSchemaTest,
+            join_on=ModelTest.tier_id == TierModel.id,
+            join_type="inner",
+            filters={"name": "Premium"},
+        )
+    ]
+    expected_count = await crud.count(async_session, joins_config=joins_config)
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        first_page = await crud.get_multi_joined(
+            db=async_session,
+            joins_config=joins_config,
+            schema_to_select=ReadSchemaTest,
+            limit=2,
+        )
+        past_last_page = await crud.get_multi_joined(
+            db=async_session,
+            joins_config=joins_config,
+            schema_to_select=ReadSchemaTest,
+            offset=len(test_data),
+            limit=2,
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert 2 < expected_count < len(test_data)
+    assert first_page["total_count"] == expected_count
+    assert len(first_page["data"]) == 2
+    assert all("fc_total_count" not in item for item in first_page["data"])
+    assert past_last_page == {"data": [], "total_count": expected_count}
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_return_model_selects_only_schema_join_columns(
+    async_session, test_data, test_data_tier
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    result = await crud.get_multi_joined(
+        db=async_session,
+        join_model=TierModel,
+        join_prefix="tier_",
+        schema_to_select=JoinedTestTier,
+        return_as_model=True,
+        sort_columns="id",
+    )
+
+    tiers = {tier["id"]: tier["name"] for tier in test_data_tier}
+    assert [(item.name, item.tier_name) for item in result["data"]] == [
+        (item["name"], tiers[item["tier_id"]])
+        for item in sorted(test_data, key=lambda item: item["id"])
+    ]
+
+    (stmt,) = [
+        stmt
+        for key, stmt in crud._statement_cache.items()
+        if key[0] == "get_multi_joined"
+    ]
+    assert [column.key for column in stmt.selected_columns] == [
+        "name",
+        "tier_id",
+        "tier_id",
+        "tier_name",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "schema", [AliasChoicesJoinedTestTier, BeforeValidatorJoinedTestTier]
+)
+async def test_get_multi_joined_return_model_keeps_columns_read_indirectly(
+    async_session, test_data, test_data_tier, schema
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    result = await FastCRUD(ModelTest).get_multi_joined(
+        db=async_session,
+        join_model=TierModel,
+        join_prefix="tier_",
+        schema_to_select=schema,
+        return_as_model=True,
+        sort_columns="id",
+    )
+
+    tiers = {tier["id"]: tier["name"] for tier in test_data_tier}
+    assert [(item.name, item.tier) for item in result["data"]] == [
+        (item["name"], tiers[item["tier_id"]])
+        for item in sorted(test_data, key=lambda item: item["id"])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_filter_only_join_uses_exists(
+    async_session, test_data, test_data_tier
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    premium_id = next(
+        tier["id"] for tier in test_data_tier if tier["name"] == "Premium"
+    )
+    result = await crud.get_multi_joined(
+        db=async_session,
+        schema_to_select=ReadSchemaTest,
+        joins_config=[
+            JoinConfig(
+                model=TierModel,
+                join_on=ModelTest.tier_id == TierModel.id,
+                join_prefix="t_",
+                join_type="inner",
+                filters={"name": "Premium"},
+            )
+        ],
+        return_as_model=True,
+        sort_columns="id",
+    )
+
+    (stmt,) = [
+        stmt
+        for key, stmt in crud._statement_cache.items()
+        if key[0] == "get_multi_joined"
+    ]
+    compiled = str(stmt)
+    assert "EXISTS" in compiled and " JOIN " not in compiled
+    expected = [item for item in test_data if item["tier_id"] == premium_id]
+    assert [item.name for item in result["data"]] == [
+        item["name"] for item in sorted(expected, key=lambda item: item["id"])
+    ]
+    assert result["total_count"] == len(expected)
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_exists_join_not_shared_across_relationship_types(
+    async_session, test_data, test_data_tier
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    def get_tiers(crud, relationship_type):
+        return crud.get_multi_joined(
+            db=async_session,
+            schema_to_select=TierSchemaTest,
+            joins_config=[
+                JoinConfig(
+                    model=ModelTest,
+                    join_on=ModelTest.tier_id == TierModel.id,
+                    join_prefix="test_",
+                    schema_to_select=TierDeleteSchemaTest,
+                    join_type="inner",
+                    relationship_type=relationship_type,
+                )
+            ],
+            id=1,
+        )
+
+    expected = await get_tiers(FastCRUD(TierModel), "one-to-one")
+    crud = FastCRUD(TierModel)
+    one_to_many = await get_tiers(crud, "one-to-many")
+    one_to_one = await get_tiers(crud, "one-to-one")
+
+    tier_users = len([item for item in test_data if item["tier_id"] == 1])
+    assert one_to_many["total_count"] == len(one_to_many["data"]) == tier_users
+    assert one_to_one == expected
+    assert one_to_one["data"] == [{"name": "Premium"}]
+    assert one_to_one["total_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_exists_join_count_parity(
+    tmp_path, test_data, test_data_tier
+):
+    joins_config = [
+        JoinConfig(
+            model=ModelTest,
+            join_on=ModelTest.tier_id == TierModel.id,
+            join_prefix="test_",
+            schema_to_select=TierDeleteSchemaTest,
+            join_type="inner",
+            filters={"category_id": 2},
+        )
+    ]
+    async with _setup_database(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'exists_join_count.db'}"
+    ) as session:
+        for tier_item in test_data_tier:
+            session.add(TierModel(**tier_item))
+        for user_item in test_data:
+            session.add(ModelTest(**user_item))
+        await session.commit()
+
+        crud = FastCRUD(TierModel)
+        window = await crud.get_multi_joined(
+            db=session, schema_to_select=TierSchemaTest, joins_config=joins_config
+        )
+        parallel = await crud.get_multi_joined(
+            db=session,
+            schema_to_select=TierSchemaTest,
+            joins_config=joins_config,
+            parallel_count=True,
+        )
+        count = await crud.count(session, joins_config=joins_config)
+
+    assert parallel == window
+    assert window["total_count"] == count == len(window["data"]) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "join_strategy, statement_count", [("selectin", 2), ("subquery", 1)]
+)
+async def test_get_multi_joined_strategy_pages_primary_records(
+    async_session, join_strategy, statement_count
+):
+    cards = [Card(title=f"Card {letter}") for letter in "ABCD"]
+    async_session.add_all(cards)
+    await async_session.flush()
+    async_session.add_all(
+        [
+            Article(title="Article 1", card_id=cards[0].id),
+            Article(title="Article 2", card_id=cards[0].id),
+            Article(title="Article 3", card_id=cards[1].id),
+            Article(title="Article 4", card_id=cards[1].id),
+            Article(title="Article 5", card_id=cards[2].id),
+        ]
+    )
+    await async_session.commit()
+
+    card_crud = FastCRUD(Card)
+    joins_config = [
+        JoinConfig(
+            model=Article,
+            join_on=Article.card_id == Card.id,
+            join_prefix="articles_",
+            schema_to_select=ArticleSchema,
+            join_type="left",
+            relationship_type="one-to-many",
+        )
+    ]
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        result = await card_crud.get_multi_joined(
+            db=async_session,
+            nest_joins=True,
+            joins_config=joins_config,
+            sort_columns="id",
+            offset=1,
+            limit=3,
+            join_strategy=join_strategy,
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == statement_count
+    assert result["total_count"] == 4
+    assert [card["title"] for card in result["data"]] == ["Card B", "Card C", "Card D"]
+    assert [
+        [article["title"] for article in card["articles"]] for card in result["data"]
+    ] == [["Article 3", "Article 4"], ["Article 5"], []]
+
+    joined = await card_crud.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=joins_config,
+        sort_columns="id",
+        offset=1,
+        limit=3,
+    )
+    assert [card["title"] for card in joined["data"]] == ["Card A", "Card B"]
+
+    past_the_end = await card_crud.get_multi_joined(
+        db=async_session,
+        joins_config=joins_config,
+        offset=10,
+        join_strategy=join_strategy,
+    )
+    assert past_the_end == {"data": [], "total_count": 4}
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_selectin_chunks_primary_keys(async_session):
+    cards = [Card(title=f"Card {letter}") for letter in "ABCD"]
+    async_session.add_all(cards)
+    await async_session.flush()
+    async_session.add_all(
+        [
+            Article(title="Article 1", card_id=cards[0].id),
+            Article(title="Article 2", card_id=cards[0].id),
+            Article(title="Article 3", card_id=cards[1].id),
+            Article(title="Article 4", card_id=cards[3].id),
+        ]
+    )
+    await async_session.commit()
+
+    card_crud = FastCRUD(Card)
+    card_crud._SELECTIN_CHUNK_SIZE = 3
+    joins_config = [
+        JoinConfig(
+            model=Article,
+            join_on=Article.card_id == Card.id,
+            join_prefix="articles_",
+            schema_to_select=ArticleSchema,
+            join_type="left",
+            relationship_type="one-to-many",
+        )
+    ]
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        result = await card_crud.get_multi_joined(
+            db=async_session,
+            nest_joins=True,
+            joins_config=joins_config,
+            sort_columns="id",
+            limit=None,
+            join_strategy="selectin",
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 3
+    joined = await card_crud.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=joins_config,
+        sort_columns="id",
+        limit=None,
+    )
+    assert result["data"] == joined["data"]
+    assert [
+        [article["title"] for article in card["articles"]] for card in result["data"]
+    ] == [["Article 1", "Article 2"], ["Article 3"], [], ["Article 4"]]
+
+    await card_crud.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=joins_config,
+        sort_columns="id",
+        limit=2,
+        join_strategy="selectin",
+    )
+    assert (
+        len([key for key in card_crud._statement_cache if key[0] == "selectin"]) == 1
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("join_strategy", ["join", "selectin", "subquery"])
+async def test_get_multi_joined_total_count_with_zero_limit(
+    async_session, join_strategy
+):
+    cards = [Card(title=f"Card {letter}") for letter in "ABCDE"]
+    async_session.add_all(cards)
+    await async_session.flush()
+    async_session.add_all(
+        [
+            Article(title="Article 1", card_id=cards[0].id),
+            Article(title="Article 2", card_id=cards[0].id),
+            Article(title="Article 3", card_id=cards[1].id),
+        ]
+    )
+    await async_session.commit()
+
+    card_crud = FastCRUD(Card)
+    kwargs = dict(
+        nest_joins=True,
+        joins_config=[
+            JoinConfig(
+                model=Article,
+                join_on=Article.card_id == Card.id,
+                join_prefix="articles_",
+                schema_to_select=ArticleSchema,
+                join_type="left",
+                relationship_type="one-to-many",
+            )
+        ],
+        join_strategy=join_strategy,
+    )
+    unpaginated = await card_crud.get_multi_joined(
+        db=async_session, limit=None, **kwargs
+    )
+    empty_page = await card_crud.get_multi_joined(db=async_session, limit=0, **kwargs)
+
+    assert unpaginated["total_count"] > 0
+    assert empty_page == {"data": [], "total_count": unpaginated["total_count"]}
+    if join_strategy != "join":
+        assert empty_page["total_count"] == len(cards)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("join_strategy", ["join", "selectin", "subquery"])
+async def test_get_multi_joined_strategy_inner_join_with_filters(
+    async_session, join_strategy
+):
+    cards = [Card(title=f"Card {i}") for i in range(1, 7)]
+    async_session.add_all(cards)
+    await async_session.flush()
+    async_session.add_all(
+        [Article(title=f"Article {card.id}", card_id=card.id) for card in cards]
+        + [Article(title="x", card_id=card.id) for card in cards[4:]]
+    )
+    await async_session.commit()
+
+    card_crud = FastCRUD(Card)
+    joins_config = [
+        JoinConfig(
+            model=Article,
+            join_on=Article.card_id == Card.id,
+            join_prefix="articles_",
+            schema_to_select=ArticleSchema,
+            join_type="inner",
+            relationship_type="one-to-many",
+            filters={"title": "x"},
+        )
+    ]
+    page = await card_crud.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=joins_config,
+        sort_columns="id",
+        limit=2,
+        join_strategy=join_strategy,
+    )
+    assert [card["id"] for card in page["data"]] == [cards[4].id, cards[5].id]
+    assert page["total_count"] == 2
+
+    past_the_end = await card_crud.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=joins_config,
+        sort_columns="id",
+        offset=2,
+        join_strategy=join_strategy,
+    )
+    assert past_the_end == {"data": [], "total_count": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("join_strategy", ["selectin", "subquery"])
+async def test_get_multi_joined_strategy_flat_rows(
+    async_session, test_data, test_data_tier, join_strategy
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    kwargs = dict(
+        schema_to_select=CreateSchemaTest,
+        join_model=TierModel,
+        join_prefix="tier_",
+        join_schema_to_select=TierSchemaTest,
+        sort_columns="name",
+        limit=4,
+        tier_id=1,
+    )
+    joined = await crud.get_multi_joined(db=async_session, **kwargs)
+    paged = await crud.get_multi_joined(
+        db=async_session, join_strategy=join_strategy, **kwargs
+    )
+
+    assert paged == joined
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_unsupported_join_strategy(async_session):
+    crud = FastCRUD(ModelTest)
+
+    with pytest.raises(ValueError) as exc_info:
+        await crud.get_multi_joined(
+            db=async_session, join_model=TierModel, join_strategy="lateral"
+        )
+
+    assert str(exc_info.value) == "Unsupported join strategy: lateral."
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_json(async_session, test_data, test_data_tier):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    kwargs = dict(
+        schema_to_select=CreateSchemaTest,
+        join_model=TierModel,
+        join_prefix="tier_",
+        join_schema_to_select=TierSchemaTest,
+        limit=3,
+    )
+    content = await crud.get_multi_joined_json(async_session, **kwargs)
+
+    assert isinstance(content, bytes)
+    assert json.loads(content) == await crud.get_multi_joined(async_session, **kwargs)
+
+    as_model = await crud.get_multi_joined_json(
+        async_session,
+        schema_to_select=JoinedTestTier,
+        join_model=TierModel,
+        join_prefix="tier_",
+        join_schema_to_select=TierSchemaTest,
+        return_as_model=True,
+        limit=3,
+    )
+    assert json.loads(as_model)["data"] == [
+        {
+            "name": item["name"],
+            "tier_id": item["tier_id"],
+            "tier_name": item["tier_name"],
+        }
+        for item in (await crud.get_multi_joined(async_session, **kwargs))["data"]
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("nest_joins", (False, True))
+async def test_get_multi_joined_stream(
+    async_session, test_data, test_data_tier, nest_joins
+):
+    for tier_item in test_data_tier:
+        async_session.add(TierModel(**tier_item))
+    for user_item in test_data:
+        async_session.add(ModelTest(**user_item))
+    await async_session.commit()
+
+    crud = FastCRUD(ModelTest)
+    joins_config = [
+        JoinConfig(
+            model=TierModel,
+            join_on=ModelTest.tier_id == TierModel.id,
+            join_prefix="tier_",
+            schema_to_select=TierSchemaTest,
+        )
+    ]
+    kwargs = {
+        "schema_to_select": ReadSchemaTest,
+        "nest_joins": nest_joins,
+        "sort_columns": "id",
+        "offset": 1,
+        "tier_id": 1,
+    }
+
+    expected = await crud.get_multi_joined(
+        db=async_session, joins_config=joins_config, limit=None, **kwargs
+    )
+    streamed = [
+        item
+        async for item in crud.get_multi_joined_stream(
+            db=async_session, joins_config=joins_config, batch_size=2, **kwargs
+        )
+    ]
+    assert streamed == expected["data"]
+    assert len(streamed) == len([i for i in test_data if i["tier_id"] == 1]) - 1
+
+    models = [
+        item
+        async for item in crud.get_multi_joined_stream(
+            db=async_session,
+            joins_config=joins_config,
+            schema_to_select=JoinedTestTier,
+            return_as_model=True,
+            limit=3,
+            batch_size=2,
+        )
+    ]
+    assert len(models) == 3
+    assert all(isinstance(item, JoinedTestTier) for item in models)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_stream_rejects_one_to_many(async_session):
+    crud = FastCRUD(Card)
+    joins_config = [
+        JoinConfig(
+            model=Article,
+            join_on=Article.card_id == Card.id,
+            join_prefix="articles_",
+            relationship_type="one-to-many",
+        )
+    ]
+    with pytest.raises(ValueError):
+        async for _ in crud.get_multi_joined_stream(
+            db=async_session, joins_config=joins_config, nest_joins=True
+        ):
+            pass